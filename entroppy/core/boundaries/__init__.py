@@ -9,9 +9,20 @@ from entroppy.core.boundaries.detection import (
 )
 from entroppy.core.boundaries.formatting import format_boundary_display, format_boundary_name
 from entroppy.core.boundaries.parsing import parse_boundary_markers
-from entroppy.core.boundaries.types import BoundaryIndex, BoundaryType
+from entroppy.core.boundaries.types import (
+    MAX_EXAMPLE_WORDS,
+    TRIGGER_END,
+    TRIGGER_START,
+    TRIGGER_SUBSTRING,
+    BoundaryIndex,
+    BoundaryType,
+)
 
 __all__ = [
+    "MAX_EXAMPLE_WORDS",
+    "TRIGGER_END",
+    "TRIGGER_START",
+    "TRIGGER_SUBSTRING",
     "BoundaryIndex",
     "BoundaryType",
     "batch_determine_boundaries",
@@ -51,7 +51,7 @@ def _check_typo_in_wordset(
         True if typo matches any word according to check_type
     """
     if check_type == "substring":
-        return typo in index.substring_set
+        return typo in index.trigger_mask
     if check_type == "prefix":
         # Check if typo is a prefix of any word (excluding exact match)
         if typo in index.prefix_index:
@@ -80,10 +80,10 @@ def is_substring_of_any(typo: str, index: BoundaryIndex) -> bool:
     Returns:
         True if typo is a substring of any word (excluding exact matches)
     """
-    # First check the pre-built substring_set for fast lookup
-    if typo in index.substring_set:
+    # First check the pre-built trigger_mask keys for fast lookup
+    if typo in index.trigger_mask:
         return True
-    # Also do a direct check against all words in case substring_set is incomplete
+    # Also do a direct check against all words in case trigger_mask is incomplete
     # This is a fallback for when validation set doesn't include all possible words
     for word in index.word_set:
         if typo in word and typo != word:
@@ -1,6 +1,7 @@
 """Boundary types and index classes."""
 
 from enum import Enum
+from itertools import islice
 
 from entroppy.utils.suffix_array import SubstringIndex
 
@@ -14,6 +15,15 @@ class BoundaryType(Enum):
     BOTH = "both"  # Both boundaries - standalone word only
 
 
+# Bit flags stored in BoundaryIndex.trigger_mask
+TRIGGER_START = 0b001  # Typo is a prefix of some word (excluding exact match)
+TRIGGER_END = 0b010  # Typo is a suffix of some word (excluding exact match)
+TRIGGER_SUBSTRING = 0b100  # Typo is a substring of some word (excluding exact match)
+
+# Number of example words kept per typo for debug logging
+MAX_EXAMPLE_WORDS = 3
+
+
 class BoundaryIndex:
     """Index for efficient boundary detection queries.
 
@@ -24,8 +34,13 @@ class BoundaryIndex:
     Attributes:
         prefix_index: Dict mapping prefixes to sets of words starting with that prefix
         suffix_index: Dict mapping suffixes to sets of words ending with that suffix
-        substring_set: Set of all substrings (excluding exact matches) from all words
+        trigger_mask: Dict mapping every substring (excluding exact matches) of all
+            words to its TRIGGER_* bit flags, so a false trigger check needs a single
+            dict lookup per index
         word_set: Original word set for reference
+        _prefix_examples: Cache of example words per typo for get_prefix_examples
+        _suffix_examples: Cache of example words per typo for get_suffix_examples
+        _substring_examples: Cache of example words per typo for get_substring_examples
         _suffix_array_index: Cached suffix array index for O(log N) substring queries
     """
 
@@ -45,13 +60,14 @@ class BoundaryIndex:
                 self.suffix_index[suffix] = set()
             self.suffix_index[suffix].add(word)
 
-    def _build_substring_set(self, word: str) -> None:
-        """Build substring set entries for a word."""
+    def _add_substring_keys(self, word: str) -> None:
+        """Add trigger_mask entries for every substring of a word."""
+        trigger_mask = self.trigger_mask
         for i in range(len(word)):
             for j in range(i + 1, len(word) + 1):
                 substring = word[i:j]
                 if substring != word:  # Exclude exact matches
-                    self.substring_set.add(substring)
+                    trigger_mask[substring] = TRIGGER_SUBSTRING
 
     def __init__(self, word_set: set[str] | frozenset[str]) -> None:
         """Build indexes from a word set.
@@ -62,14 +78,55 @@ class BoundaryIndex:
         self.word_set = word_set
         self.prefix_index: dict[str, set[str]] = {}
         self.suffix_index: dict[str, set[str]] = {}
-        self.substring_set: set[str] = set()
+        self.trigger_mask: dict[str, int] = {}
         self._suffix_array_index: SubstringIndex | None = None  # Lazy init for suffix array
+        # Lazily filled, only debug logging asks for example words
+        self._prefix_examples: dict[str, tuple[str, ...]] = {}
+        self._suffix_examples: dict[str, tuple[str, ...]] = {}
+        self._substring_examples: dict[str, tuple[str, ...]] = {}
 
         # Build indexes for each word
         for word in word_set:
             self._build_prefix_index(word)
             self._build_suffix_index(word)
-            self._build_substring_set(word)
+            self._add_substring_keys(word)
+
+        self._add_prefix_and_suffix_flags()
+
+    def __getstate__(self) -> dict[str, object]:
+        """Pickle the built indexes, leaving out caches that are rebuilt on demand.
+
+        Lets a parent process build the index once and hand it to worker processes,
+        instead of every worker rebuilding it from the word set.
+        """
+        state = self.__dict__.copy()
+        state["_suffix_array_index"] = None
+        state["_prefix_examples"] = {}
+        state["_suffix_examples"] = {}
+        state["_substring_examples"] = {}
+        return state
+
+    def _has_other_word(self, typo: str, index: dict[str, set[str]]) -> bool:
+        """Check if an index entry holds any word other than the typo itself."""
+        words = index.get(typo)
+        if not words:
+            return False
+        return len(words) > 1 or typo not in words
+
+    def _add_prefix_and_suffix_flags(self) -> None:
+        """Set the TRIGGER_START/TRIGGER_END bits from the finalized indexes.
+
+        Every prefix or suffix of a word that isn't the word itself is also a
+        substring, so trigger_mask already has a key for every typo with a non-zero mask.
+        """
+        trigger_mask = self.trigger_mask
+        for substring in trigger_mask:
+            mask = TRIGGER_SUBSTRING
+            if self._has_other_word(substring, self.prefix_index):
+                mask |= TRIGGER_START
+            if self._has_other_word(substring, self.suffix_index):
+                mask |= TRIGGER_END
+            trigger_mask[substring] = mask
 
     def batch_check_start(self, typos: list[str]) -> dict[str, bool]:
         """Batch check if typos appear as prefixes of any word.
@@ -109,6 +166,65 @@ class BoundaryIndex:
                 results[typo] = False
         return results
 
+    def _examples_from_index(
+        self, typo: str, index: dict[str, set[str]], cache: dict[str, tuple[str, ...]]
+    ) -> tuple[str, ...]:
+        """Get cached example words from an index entry, excluding the typo itself."""
+        examples = cache.get(typo)
+        if examples is None:
+            words = index.get(typo, ())
+            candidates = (word for word in words if word != typo)
+            examples = tuple(islice(candidates, MAX_EXAMPLE_WORDS))
+            cache[typo] = examples
+        return examples
+
+    def get_prefix_examples(self, typo: str) -> tuple[str, ...]:
+        """Get up to MAX_EXAMPLE_WORDS words that start with typo (excluding exact match).
+
+        Args:
+            typo: The typo string
+
+        Returns:
+            Tuple of example words, computed once per typo and cached
+        """
+        return self._examples_from_index(typo, self.prefix_index, self._prefix_examples)
+
+    def get_suffix_examples(self, typo: str) -> tuple[str, ...]:
+        """Get up to MAX_EXAMPLE_WORDS words that end with typo (excluding exact match).
+
+        Args:
+            typo: The typo string
+
+        Returns:
+            Tuple of example words, computed once per typo and cached
+        """
+        return self._examples_from_index(typo, self.suffix_index, self._suffix_examples)
+
+    def get_substring_examples(self, typo: str) -> tuple[str, ...]:
+        """Get up to MAX_EXAMPLE_WORDS words containing typo in the middle.
+
+        Words where typo is a prefix or suffix are excluded, as is the exact match.
+
+        Args:
+            typo: The typo string
+
+        Returns:
+            Tuple of example words, computed once per typo and cached
+        """
+        examples = self._substring_examples.get(typo)
+        if examples is None:
+            if typo in self.trigger_mask:
+                candidates = (
+                    word
+                    for word in self.word_set
+                    if typo in word and not word.startswith(typo) and not word.endswith(typo)
+                )
+                examples = tuple(islice(candidates, MAX_EXAMPLE_WORDS))
+            else:
+                examples = ()
+            self._substring_examples[typo] = examples
+        return examples
+
     def get_suffix_array_index(self) -> SubstringIndex:
         """Get or build cached suffix array index.
 
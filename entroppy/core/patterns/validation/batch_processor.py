@@ -39,6 +39,9 @@ from entroppy.utils.debug import is_debug_correction
 if TYPE_CHECKING:
     from entroppy.utils.debug import DebugTypoMatcher
 
+# Upper bound on patterns sent to a worker per task in parallel validation
+_MAX_WORKER_CHUNKSIZE = 128
+
 
 def _check_pattern_occurrence_count(
     typo_pattern: str,
@@ -414,7 +417,11 @@ def run_parallel_validation(
         initargs=(context,),
     ) as pool:
         pattern_items = list(patterns_to_validate.items())
-        results_iter = pool.imap_unordered(_validate_single_pattern_worker, pattern_items)
+        # Send patterns in chunks so each IPC round trip carries many small tasks
+        chunksize = max(1, min(_MAX_WORKER_CHUNKSIZE, len(pattern_items) // (jobs * 4)))
+        results_iter = pool.imap_unordered(
+            _validate_single_pattern_worker, pattern_items, chunksize=chunksize
+        )
 
         # Wrap with progress bar if verbose
         if verbose:
@@ -13,6 +13,10 @@ from entroppy.processing.stages.data_models import DictionaryData, TypoGeneratio
 from entroppy.processing.stages.worker_context import WorkerContext, get_worker_context, init_worker
 from entroppy.resolution import process_word
 from entroppy.utils.debug import DebugTypoMatcher
+from entroppy.utils.helpers import BatchedProgress
+
+# Upper bound on words sent to a worker per task
+_MAX_WORKER_CHUNKSIZE = 256
 
 
 def process_word_worker(word: str) -> tuple[str, list[tuple[str, str]], list[str]]:
@@ -73,24 +77,28 @@ def _process_multiprocessing(
         initializer=init_worker,
         initargs=(context,),
     ) as pool:
-        results = pool.imap_unordered(process_word_worker, dict_data.source_words)
+        total = len(dict_data.source_words)
+        # Send words to workers in chunks so they don't wait on the result queue
+        # between words, keeping ~4 chunks per worker to balance the tail
+        chunksize = max(1, min(_MAX_WORKER_CHUNKSIZE, total // (config.jobs * 4)))
+        results = pool.imap_unordered(
+            process_word_worker, dict_data.source_words, chunksize=chunksize
+        )
 
-        # Wrap with progress bar
+        # Advance the progress bar once per chunk rather than once per word
+        progress_bar: Any = None
         if verbose:
-            results_wrapped_iter: Any = tqdm(
-                results,
-                total=len(dict_data.source_words),
-                desc="Processing words",
-                unit="word",
-            )
-        else:
-            results_wrapped_iter = results
-
-        for _word, corrections, debug_messages in results_wrapped_iter:
+            progress_bar = tqdm(total=total, desc="Processing words", unit="word")
+        progress = BatchedProgress(progress_bar, chunksize)
+
+        for _word, corrections, debug_messages in results:
             for typo, correction_word in corrections:
                 typo_map[typo].append(correction_word)
             # Collect debug messages from workers
             all_debug_messages.extend(debug_messages)
+            progress.advance()
+
+        progress.close()
 
     # Print all collected debug messages after workers complete
     for message in all_debug_messages:
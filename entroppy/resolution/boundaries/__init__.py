@@ -8,7 +8,10 @@ from entroppy.resolution.boundaries.logging import (
     _log_none_boundary_rejection,
     _log_right_boundary_rejection,
 )
-from entroppy.resolution.boundaries.selection import choose_boundary_for_typo
+from entroppy.resolution.boundaries.selection import (
+    choose_boundaries_for_typos,
+    choose_boundary_for_typo,
+)
 from entroppy.resolution.boundaries.utils import (
     _check_typo_in_target_word,
     _format_incorrect_transformation,
@@ -34,6 +37,7 @@ __all__ = [
     "_log_right_boundary_rejection",
     "_should_skip_short_typo",
     "apply_user_word_boundary_override",
+    "choose_boundaries_for_typos",
     "choose_boundary_for_typo",
     "choose_strictest_boundary",
 ]
@@ -1,8 +1,11 @@
 """Debug logging functions for boundary selection."""
 
+from typing import TYPE_CHECKING
+
 from entroppy.core import BoundaryType
 from entroppy.core.boundaries import BoundaryIndex
 from entroppy.utils.debug import DebugTypoMatcher, is_debug_typo, is_debug_word, log_debug_typo
+from entroppy.utils.logging import is_debug_enabled
 
 from .utils import (
     _check_typo_in_target_word,
@@ -12,6 +15,33 @@ from .utils import (
     _get_example_words_with_suffix,
 )
 
+if TYPE_CHECKING:
+    from entroppy.resolution.false_trigger_check import FalseTriggerDetails
+
+# Boundary orders to try, least to most restrictive, shared across calls
+_ORDER_SUFFIX = (BoundaryType.NONE, BoundaryType.RIGHT, BoundaryType.BOTH)
+_ORDER_PREFIX = (BoundaryType.NONE, BoundaryType.LEFT, BoundaryType.BOTH)
+_ORDER_MIDDLE = (BoundaryType.NONE, BoundaryType.BOTH)
+_ORDER_ALL = (BoundaryType.NONE, BoundaryType.LEFT, BoundaryType.RIGHT, BoundaryType.BOTH)
+
+_NO_RELATIONSHIP = (False, False, False)
+
+# Boundary order by target word relationship (is_prefix, is_suffix, is_middle).
+# Any other relationship, including none, uses _ORDER_ALL
+_ORDER_BY_RELATIONSHIP: dict[tuple[bool, bool, bool], tuple[BoundaryType, ...]] = {
+    # Typo is suffix of target - skip LEFT (doesn't match relationship)
+    # LEFT boundary means "match at word start", but typo appears at word end
+    (False, True, False): _ORDER_SUFFIX,
+    # Typo is both prefix and suffix of target (e.g. "aba" in "ababa") - suffix wins
+    (True, True, False): _ORDER_SUFFIX,
+    # Typo is prefix of target - skip RIGHT (doesn't match relationship)
+    # RIGHT boundary means "match at word end", but typo appears at word start
+    (True, False, False): _ORDER_PREFIX,
+    # Typo is middle substring - skip LEFT and RIGHT (both incompatible)
+    # Neither LEFT nor RIGHT make sense for middle substrings
+    (False, False, True): _ORDER_MIDDLE,
+}
+
 
 def _should_debug_boundary_selection(
     typo: str,
@@ -28,20 +58,49 @@ def _should_debug_boundary_selection(
         debug_typo_matcher: Matcher for debug typos (with wildcards/boundaries)
 
     Returns:
-        True if debugging should be enabled, False otherwise
+        True if debugging should be enabled, False otherwise. Also False when no
+        handler would emit DEBUG messages, so no log messages or examples are built
+        only to be dropped.
     """
-    if word:
-        if is_debug_word(word, debug_words or set()):
-            return True
-    if debug_typo_matcher:
+    is_debug = word is not None and is_debug_word(word, debug_words or set())
+    if not is_debug and debug_typo_matcher:
         # Check if typo matches any debug pattern (try with NONE boundary as placeholder)
-        return is_debug_typo(typo, BoundaryType.NONE, debug_typo_matcher)
-    return False
+        is_debug = is_debug_typo(typo, BoundaryType.NONE, debug_typo_matcher)
+    return is_debug and is_debug_enabled()
+
+
+def _get_matching_patterns(
+    typo: str,
+    boundary: BoundaryType,
+    debug_typo_matcher: DebugTypoMatcher | None,
+    patterns_cache: dict[BoundaryType, list[str]] | None = None,
+) -> list[str] | None:
+    """Get the debug patterns matching a typo, reusing results from patterns_cache.
+
+    Args:
+        typo: The typo string
+        boundary: The boundary type to match patterns for
+        debug_typo_matcher: Matcher for debug typos (with wildcards/boundaries)
+        patterns_cache: Optional per-typo cache of matching patterns by boundary,
+            filled as boundaries are looked up
+
+    Returns:
+        List of matching patterns, or None if there is no matcher
+    """
+    if not debug_typo_matcher:
+        return None
+    if patterns_cache is None:
+        return debug_typo_matcher.get_matching_patterns(typo, boundary)
+    patterns = patterns_cache.get(boundary)
+    if patterns is None:
+        patterns = debug_typo_matcher.get_matching_patterns(typo, boundary)
+        patterns_cache[boundary] = patterns
+    return patterns
 
 
 def _determine_boundary_order(
     typo: str, word: str | None
-) -> tuple[list[BoundaryType], tuple[bool, bool, bool]]:
+) -> tuple[tuple[BoundaryType, ...], tuple[bool, bool, bool]]:
     """Determine the boundary order based on typo's relationship to target word.
 
     Args:
@@ -49,41 +108,12 @@ def _determine_boundary_order(
         word: Optional target word to check relationship against
 
     Returns:
-        Tuple of (boundary_order, relationship) where relationship is
-        (is_prefix, is_suffix, is_middle)
+        Tuple of (boundary_order, relationship) where boundary_order is one of the
+        shared _ORDER_* tuples and relationship is (is_prefix, is_suffix, is_middle)
     """
     # Check target word relationship first to determine appropriate boundary order
-    target_is_prefix, target_is_suffix, target_is_middle = (
-        _check_typo_in_target_word(typo, word) if word else (False, False, False)
-    )
-
-    # Build boundary order based on target word relationship
-    if target_is_suffix:
-        # Typo is suffix of target - skip LEFT (doesn't match relationship)
-        # LEFT boundary means "match at word start", but typo appears at word end
-        # Try: NONE, RIGHT, BOTH
-        boundary_order = [BoundaryType.NONE, BoundaryType.RIGHT, BoundaryType.BOTH]
-    elif target_is_prefix:
-        # Typo is prefix of target - skip RIGHT (doesn't match relationship)
-        # RIGHT boundary means "match at word end", but typo appears at word start
-        # Try: NONE, LEFT, BOTH
-        boundary_order = [BoundaryType.NONE, BoundaryType.LEFT, BoundaryType.BOTH]
-    elif target_is_middle:
-        # Typo is middle substring - skip LEFT and RIGHT (both incompatible)
-        # Neither LEFT nor RIGHT make sense for middle substrings
-        # Try: NONE, BOTH
-        boundary_order = [BoundaryType.NONE, BoundaryType.BOTH]
-    else:
-        # Default order: no target word relationship detected
-        # Try all boundaries: NONE, LEFT, RIGHT, BOTH
-        boundary_order = [
-            BoundaryType.NONE,
-            BoundaryType.LEFT,
-            BoundaryType.RIGHT,
-            BoundaryType.BOTH,
-        ]
-
-    return boundary_order, (target_is_prefix, target_is_suffix, target_is_middle)
+    relationship = _check_typo_in_target_word(typo, word) if word else _NO_RELATIONSHIP
+    return _ORDER_BY_RELATIONSHIP.get(relationship, _ORDER_ALL), relationship
 
 
 def _log_boundary_order_selection(
@@ -91,6 +121,7 @@ def _log_boundary_order_selection(
     word: str | None,
     relationship: tuple[bool, bool, bool],
     debug_typo_matcher: DebugTypoMatcher | None,
+    patterns_cache: dict[BoundaryType, list[str]] | None = None,
 ) -> None:
     """Log the boundary order selection for debugging.
 
@@ -99,6 +130,7 @@ def _log_boundary_order_selection(
         word: Optional word associated with this typo
         relationship: Tuple of (is_prefix, is_suffix, is_middle)
         debug_typo_matcher: Matcher for debug typos (with wildcards/boundaries)
+        patterns_cache: Optional per-typo cache of matching debug patterns
     """
     target_is_prefix, target_is_suffix, target_is_middle = relationship
     word_info = f" (word: {word})" if word else ""
@@ -124,11 +156,7 @@ def _log_boundary_order_selection(
     log_debug_typo(
         typo,
         message,
-        (
-            debug_typo_matcher.get_matching_patterns(typo, BoundaryType.NONE)
-            if debug_typo_matcher
-            else None
-        ),
+        _get_matching_patterns(typo, BoundaryType.NONE, debug_typo_matcher, patterns_cache),
         "Stage 3",
     )
 
@@ -136,7 +164,7 @@ def _log_boundary_order_selection(
 def _log_none_boundary_rejection(
     typo: str,
     word: str | None,
-    details: dict[str, bool | str | None],
+    details: "FalseTriggerDetails",
     validation_index: BoundaryIndex,
     source_index: BoundaryIndex,
 ) -> list[str]:
@@ -145,7 +173,7 @@ def _log_none_boundary_rejection(
     Args:
         typo: The typo string
         word: Optional word associated with this typo
-        details: Details dictionary from false trigger check
+        details: Details from false trigger check
         validation_index: Boundary index for validation set
         source_index: Boundary index for source words
 
@@ -153,13 +181,13 @@ def _log_none_boundary_rejection(
         List of example lines
     """
     example_lines = []
-    if details["is_substring"]:
+    if details.is_substring:
         examples = _get_example_words_with_substring(typo, validation_index, source_index)
         if not examples:
             # Fallback: check if it's a prefix or suffix
-            if details["would_trigger_start"]:
+            if details.would_trigger_start:
                 examples = _get_example_words_with_prefix(typo, validation_index, source_index)
-            elif details["would_trigger_end"]:
+            elif details.would_trigger_end:
                 examples = _get_example_words_with_suffix(typo, validation_index, source_index)
 
         if examples:
@@ -176,7 +204,7 @@ def _log_none_boundary_rejection(
 def _log_left_boundary_rejection(
     typo: str,
     word: str | None,
-    details: dict[str, bool | str | None],
+    details: "FalseTriggerDetails",
     validation_index: BoundaryIndex,
     source_index: BoundaryIndex,
 ) -> list[str]:
@@ -185,7 +213,7 @@ def _log_left_boundary_rejection(
     Args:
         typo: The typo string
         word: Optional word associated with this typo
-        details: Details dictionary from false trigger check
+        details: Details from false trigger check
         validation_index: Boundary index for validation set
         source_index: Boundary index for source words
 
@@ -193,7 +221,7 @@ def _log_left_boundary_rejection(
         List of example lines
     """
     example_lines = []
-    if details["would_trigger_start"]:
+    if details.would_trigger_start:
         examples = _get_example_words_with_prefix(typo, validation_index, source_index)
         if examples:
             example_word = examples[0]
@@ -209,7 +237,7 @@ def _log_left_boundary_rejection(
 def _log_right_boundary_rejection(
     typo: str,
     word: str | None,
-    details: dict[str, bool | str | None],
+    details: "FalseTriggerDetails",
     validation_index: BoundaryIndex,
     source_index: BoundaryIndex,
 ) -> list[str]:
@@ -218,7 +246,7 @@ def _log_right_boundary_rejection(
     Args:
         typo: The typo string
         word: Optional word associated with this typo
-        details: Details dictionary from false trigger check
+        details: Details from false trigger check
         validation_index: Boundary index for validation set
         source_index: Boundary index for source words
 
@@ -226,7 +254,7 @@ def _log_right_boundary_rejection(
         List of example lines
     """
     example_lines = []
-    if details["would_trigger_end"]:
+    if details.would_trigger_end:
         examples = _get_example_words_with_suffix(typo, validation_index, source_index)
         if examples:
             example_word = examples[0]
@@ -242,26 +270,27 @@ def _log_right_boundary_rejection(
 def _build_fallback_rejection_message(
     boundary: BoundaryType,
     word_info: str,
-    details: dict[str, bool | str | None],
+    details: "FalseTriggerDetails",
 ) -> str:
     """Build fallback rejection message when no examples found.
 
     Args:
         boundary: The boundary that was rejected
         word_info: Word info string
-        details: Details dictionary from false trigger check
+        details: Details from false trigger check
 
     Returns:
         Fallback message string
     """
+    would_trigger_start = details.would_trigger_start
+    would_trigger_end = details.would_trigger_end
+
     reason_parts = []
-    if details["would_trigger_start"]:
+    if would_trigger_start:
         reason_parts.append("appears as prefix")
-    if details["would_trigger_end"]:
+    if would_trigger_end:
         reason_parts.append("appears as suffix")
-    if details["is_substring"] and not (
-        details["would_trigger_start"] or details["would_trigger_end"]
-    ):
+    if details.is_substring and not (would_trigger_start or would_trigger_end):
         reason_parts.append("appears as substring")
     reason_str = ", ".join(reason_parts) if reason_parts else "unknown reason"
     return (
@@ -274,10 +303,11 @@ def _log_boundary_rejection(
     typo: str,
     word: str | None,
     boundary: BoundaryType,
-    details: dict[str, bool | str | None],
+    details: "FalseTriggerDetails",
     validation_index: BoundaryIndex,
     source_index: BoundaryIndex,
     debug_typo_matcher: DebugTypoMatcher | None,
+    patterns_cache: dict[BoundaryType, list[str]] | None = None,
 ) -> None:
     """Log why a boundary was rejected with concrete examples.
 
@@ -285,10 +315,11 @@ def _log_boundary_rejection(
         typo: The typo string
         word: Optional word associated with this typo
         boundary: The boundary that was rejected
-        details: Details dictionary from false trigger check
+        details: Details from false trigger check
         validation_index: Boundary index for validation set
         source_index: Boundary index for source words
         debug_typo_matcher: Matcher for debug typos (with wildcards/boundaries)
+        patterns_cache: Optional per-typo cache of matching debug patterns
     """
     word_info = f" (word: {word})" if word else ""
     example_lines = []
@@ -321,7 +352,7 @@ def _log_boundary_rejection(
     log_debug_typo(
         typo,
         message,
-        (debug_typo_matcher.get_matching_patterns(typo, boundary) if debug_typo_matcher else None),
+        _get_matching_patterns(typo, boundary, debug_typo_matcher, patterns_cache),
         "Stage 3",
     )
 
@@ -330,6 +361,7 @@ def _log_fallback_boundary(
     typo: str,
     word: str | None,
     debug_typo_matcher: DebugTypoMatcher | None,
+    patterns_cache: dict[BoundaryType, list[str]] | None = None,
 ) -> None:
     """Log when falling back to BOTH boundary.
 
@@ -337,16 +369,13 @@ def _log_fallback_boundary(
         typo: The typo string
         word: Optional word associated with this typo
         debug_typo_matcher: Matcher for debug typos (with wildcards/boundaries)
+        patterns_cache: Optional per-typo cache of matching debug patterns
     """
     word_info = f" (word: {word})" if word else ""
     log_debug_typo(
         typo,
         f"All boundaries would cause false triggers, using fallback "
         f"'{BoundaryType.BOTH.value}'{word_info}",
-        (
-            debug_typo_matcher.get_matching_patterns(typo, BoundaryType.BOTH)
-            if debug_typo_matcher
-            else None
-        ),
+        _get_matching_patterns(typo, BoundaryType.BOTH, debug_typo_matcher, patterns_cache),
         "Stage 3",
     )
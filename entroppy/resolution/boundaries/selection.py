@@ -9,9 +9,38 @@ from entroppy.resolution.boundaries.logging import (
     _log_fallback_boundary,
     _should_debug_boundary_selection,
 )
-from entroppy.resolution.false_trigger_check import _check_false_trigger_with_details
+from entroppy.resolution.false_trigger_check import (
+    FalseTriggerDetails,
+    _check_false_trigger_with_details,
+    _get_trigger_masks,
+    _would_cause_false_trigger_for_mask,
+)
 from entroppy.utils.debug import DebugTypoMatcher, is_debug_typo, log_debug_typo
 
+# Module-level alias so the hot path skips the BoundaryType attribute lookup
+_B_BOTH = BoundaryType.BOTH
+
+
+def _choose_boundary_for_mask(
+    boundary_order: tuple[BoundaryType, ...],
+    mask: int,
+    relationship: tuple[bool, bool, bool],
+) -> BoundaryType:
+    """Pick the first boundary in order that the combined trigger mask allows.
+
+    Args:
+        boundary_order: Boundaries to try, least restrictive first
+        mask: Validation and source TRIGGER_* bit flags OR-ed together
+        relationship: Target word check as (is_prefix, is_suffix, is_middle)
+
+    Returns:
+        The chosen boundary, or BOTH if every boundary would cause false triggers
+    """
+    for boundary in boundary_order:
+        if not _would_cause_false_trigger_for_mask(boundary, mask, relationship):
+            return boundary
+    return _B_BOTH
+
 
 def choose_boundary_for_typo(
     typo: str,
@@ -44,12 +73,22 @@ def choose_boundary_for_typo(
     # Check if we should debug this boundary selection
     is_debug = _should_debug_boundary_selection(typo, word, debug_words, debug_typo_matcher)
 
-    # Determine boundary order based on target word relationship
+    # Determine boundary order based on target word relationship. The relationship is
+    # the target word check result, reused for every boundary checked below
     boundary_order, relationship = _determine_boundary_order(typo, word)
 
-    # Log boundary order selection if debugging
-    if is_debug:
-        _log_boundary_order_selection(typo, word, relationship, debug_typo_matcher)
+    if not is_debug:
+        # Fast path: only the verdict is needed, skip building details. The trigger
+        # masks and the target word relationship are both looked up once and shared
+        # by every boundary checked
+        val_mask, src_mask = _get_trigger_masks(typo, validation_index, source_index, None)
+        return _choose_boundary_for_mask(boundary_order, val_mask | src_mask, relationship)
+
+    # Matching debug patterns per boundary, shared by all log calls for this typo
+    patterns_cache: dict[BoundaryType, list[str]] = {}
+
+    # Log boundary order selection
+    _log_boundary_order_selection(typo, word, relationship, debug_typo_matcher, patterns_cache)
 
     # Check each boundary from least to most restrictive
     for boundary in boundary_order:
@@ -63,6 +102,7 @@ def choose_boundary_for_typo(
             validation_index,
             source_index,
             target_word=word,
+            target_bits=relationship,
         )
         if not would_cause:
             # Boundary selected - logging will be done by log_boundary_selection_details
@@ -70,33 +110,86 @@ def choose_boundary_for_typo(
             return boundary
 
         # Log why this boundary was rejected with concrete examples
-        if is_debug:
-            _log_boundary_rejection(
-                typo,
-                word,
-                boundary,
-                details,
-                validation_index,
-                source_index,
-                debug_typo_matcher,
-            )
+        _log_boundary_rejection(
+            typo,
+            word,
+            boundary,
+            details,
+            validation_index,
+            source_index,
+            debug_typo_matcher,
+            patterns_cache,
+        )
 
     # If all boundaries would cause false triggers, return BOTH as safest fallback
     # (most restrictive, least likely to cause issues)
-    if is_debug:
-        _log_fallback_boundary(typo, word, debug_typo_matcher)
+    _log_fallback_boundary(typo, word, debug_typo_matcher, patterns_cache)
     return BoundaryType.BOTH
 
 
-def _build_safety_details_for_boundary(boundary: BoundaryType, details: dict) -> list[str]:
+def choose_boundaries_for_typos(
+    typos: list[str],
+    words: list[str | None],
+    validation_index: BoundaryIndex,
+    source_index: BoundaryIndex,
+    debug_words: set[str] | None = None,
+    debug_typo_matcher: DebugTypoMatcher | None = None,
+) -> list[BoundaryType]:
+    """Choose boundaries for many (typo, word) pairs at once.
+
+    Same result as calling choose_boundary_for_typo for each pair, but each
+    distinct typo's trigger masks are looked up only once. Pairs that need
+    debug logging go through choose_boundary_for_typo so they are logged as usual.
+
+    Args:
+        typos: The typo strings
+        words: The target word for each typo (same length as typos, None if not available)
+        validation_index: Boundary index for validation set
+        source_index: Boundary index for source words
+        debug_words: Set of words to debug (exact matches)
+        debug_typo_matcher: Matcher for debug typos (with wildcards/boundaries)
+
+    Returns:
+        List of chosen boundary types, one per (typo, word) pair
+    """
+    masks: dict[str, int] = {}
+    boundaries: list[BoundaryType] = []
+    for typo, word in zip(typos, words, strict=True):
+        if _should_debug_boundary_selection(typo, word, debug_words, debug_typo_matcher):
+            # pylint: disable=duplicate-code
+            # False positive: This is a call to choose_boundary_for_typo with standard
+            # parameters. The similar code in correction_processor.py is the same function
+            # call, which is expected and not actual duplicate code.
+            boundaries.append(
+                choose_boundary_for_typo(
+                    typo,
+                    validation_index,
+                    source_index,
+                    debug_words=debug_words,
+                    debug_typo_matcher=debug_typo_matcher,
+                    word=word,
+                )
+            )
+            continue
+
+        mask = masks.get(typo)
+        if mask is None:
+            val_mask, src_mask = _get_trigger_masks(typo, validation_index, source_index, None)
+            mask = masks[typo] = val_mask | src_mask
+
+        boundary_order, relationship = _determine_boundary_order(typo, word)
+        boundaries.append(_choose_boundary_for_mask(boundary_order, mask, relationship))
+
+    return boundaries
+
+
+def _build_safety_details_for_boundary(
+    boundary: BoundaryType, would_trigger_start: bool, would_trigger_end: bool, is_substring: bool
+) -> list[str]:
     """Build safety details explaining why boundary is safe."""
     safety_details = []
 
-    if (
-        not details["would_trigger_start"]
-        and not details["would_trigger_end"]
-        and not details["is_substring"]
-    ):
+    if not would_trigger_start and not would_trigger_end and not is_substring:
         safety_details.append("typo doesn't appear in validation or source words")
     else:
         if boundary == BoundaryType.NONE:
@@ -117,14 +210,16 @@ def _build_safety_details_for_boundary(boundary: BoundaryType, details: dict) ->
     return safety_details
 
 
-def _build_check_parts(details: dict) -> list[str]:
+def _build_check_parts(
+    would_trigger_start: bool, would_trigger_end: bool, is_substring: bool
+) -> list[str]:
     """Build list of check parts that passed."""
     check_parts = []
-    if not details["would_trigger_start"]:
+    if not would_trigger_start:
         check_parts.append("not a prefix")
-    if not details["would_trigger_end"]:
+    if not would_trigger_end:
         check_parts.append("not a suffix")
-    if not details["is_substring"]:
+    if not is_substring:
         check_parts.append("not a substring")
     return check_parts
 
@@ -133,17 +228,24 @@ def log_boundary_selection_details(
     typo: str,
     word: str | None,
     boundary: BoundaryType,
-    details: dict,
+    details: FalseTriggerDetails,
     debug_typo_matcher: DebugTypoMatcher | None,
 ) -> None:
     """Log boundary selection details for debug typos."""
     if not debug_typo_matcher or not is_debug_typo(typo, boundary, debug_typo_matcher):
         return
 
+    # Read the combined flags once, both helpers below need all three
+    would_trigger_start = details.would_trigger_start
+    would_trigger_end = details.would_trigger_end
+    is_substring = details.is_substring
+
     word_info = f" (word: {word})" if word else ""
-    safety_details = _build_safety_details_for_boundary(boundary, details)
+    safety_details = _build_safety_details_for_boundary(
+        boundary, would_trigger_start, would_trigger_end, is_substring
+    )
 
-    check_parts = _build_check_parts(details)
+    check_parts = _build_check_parts(would_trigger_start, would_trigger_end, is_substring)
     if check_parts:
         safety_details.append(f"checks passed: {', '.join(check_parts)}")
 
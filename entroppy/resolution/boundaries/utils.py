@@ -1,7 +1,9 @@
 """Boundary type utilities for collision resolution."""
 
+from itertools import islice
+
 from entroppy.core import BoundaryType
-from entroppy.core.boundaries import BoundaryIndex
+from entroppy.core.boundaries import MAX_EXAMPLE_WORDS, BoundaryIndex
 from entroppy.utils.debug import DebugTypoMatcher, log_if_debug_correction
 
 
@@ -99,14 +101,16 @@ def _check_typo_in_target_word(
     return is_prefix, is_suffix, is_substring
 
 
-def _collect_examples_from_index(
-    typo: str, index: dict[str, set[str]], examples: list[str], max_examples: int = 3
-) -> None:
-    """Collect example words from an index, avoiding duplicates."""
-    if typo in index:
-        for word in index[typo]:
-            if word != typo and word not in examples and len(examples) < max_examples:
-                examples.append(word)
+def _merge_examples(
+    validation_examples: tuple[str, ...], source_examples: tuple[str, ...]
+) -> list[str]:
+    """Merge cached examples from both indexes, validation words first, without duplicates."""
+    examples = list(validation_examples)
+    if len(examples) < MAX_EXAMPLE_WORDS:
+        seen = set(examples)
+        candidates = (word for word in source_examples if word not in seen)
+        examples.extend(islice(candidates, MAX_EXAMPLE_WORDS - len(examples)))
+    return examples
 
 
 def _get_example_words_with_prefix(
@@ -122,13 +126,9 @@ def _get_example_words_with_prefix(
     Returns:
         List of example words (up to 3 total, prioritizing validation words)
     """
-    examples: list[str] = []
-    # Check validation index first
-    _collect_examples_from_index(typo, validation_index.prefix_index, examples)
-    # Then check source index if we need more examples
-    if len(examples) < 3:
-        _collect_examples_from_index(typo, source_index.prefix_index, examples)
-    return examples
+    return _merge_examples(
+        validation_index.get_prefix_examples(typo), source_index.get_prefix_examples(typo)
+    )
 
 
 def _get_example_words_with_suffix(
@@ -144,31 +144,9 @@ def _get_example_words_with_suffix(
     Returns:
         List of example words (up to 3 total, prioritizing validation words)
     """
-    examples: list[str] = []
-    # Check validation index first
-    _collect_examples_from_index(typo, validation_index.suffix_index, examples)
-    # Then check source index if we need more examples
-    if len(examples) < 3:
-        _collect_examples_from_index(typo, source_index.suffix_index, examples)
-    return examples
-
-
-def _is_valid_substring_match(typo: str, word: str) -> bool:
-    """Check if word contains typo as a substring (not prefix/suffix)."""
-    return typo in word and word != typo and not word.startswith(typo) and not word.endswith(typo)
-
-
-def _collect_substring_examples(
-    typo: str, word_set: set[str], examples: list[str], max_examples: int = 3
-) -> None:
-    """Collect example words containing typo as substring from word set."""
-    for word in word_set:
-        if (
-            _is_valid_substring_match(typo, word)
-            and word not in examples
-            and len(examples) < max_examples
-        ):
-            examples.append(word)
+    return _merge_examples(
+        validation_index.get_suffix_examples(typo), source_index.get_suffix_examples(typo)
+    )
 
 
 def _get_example_words_with_substring(
@@ -184,23 +162,9 @@ def _get_example_words_with_substring(
     Returns:
         List of example words (up to 3 total, prioritizing validation words)
     """
-    examples: list[str] = []
-    # Check validation index first
-    validation_set = (
-        set(validation_index.word_set)
-        if isinstance(validation_index.word_set, frozenset)
-        else validation_index.word_set
+    return _merge_examples(
+        validation_index.get_substring_examples(typo), source_index.get_substring_examples(typo)
     )
-    _collect_substring_examples(typo, validation_set, examples)
-    # Then check source index if we need more examples
-    if len(examples) < 3:
-        source_set = (
-            set(source_index.word_set)
-            if isinstance(source_index.word_set, frozenset)
-            else source_index.word_set
-        )
-        _collect_substring_examples(typo, source_set, examples)
-    return examples
 
 
 def _format_incorrect_transformation(conflict_word: str, typo_str: str, word_str: str) -> str:
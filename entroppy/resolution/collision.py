@@ -1,7 +1,7 @@
 """Collision resolution for typo corrections."""
 
 from multiprocessing import Pool
-from typing import Any
+from typing import Any, Iterable
 
 from loguru import logger
 from tqdm import tqdm
@@ -10,112 +10,121 @@ from entroppy.core import BoundaryType, Correction
 from entroppy.core.boundaries import BoundaryIndex
 from entroppy.matching import ExclusionMatcher
 from entroppy.utils.debug import DebugTypoMatcher
+from entroppy.utils.helpers import BatchedProgress
 
-from .boundaries.selection import log_boundary_selection_details
-from .collision_helpers import _process_collision_item, _process_single_word_item
+from .collision_helpers import (
+    _iter_single_word_items,
+    _log_boundary_details,
+    _process_collision_item,
+    _process_single_word_item,
+)
 from .processing import process_collision_case, process_single_word_correction
 from .worker_context import (
     CollisionResolutionContext,
     get_collision_worker_context,
     get_worker_indexes,
+    get_worker_matchers,
+    get_worker_word_sets,
     init_collision_worker,
 )
 
+# Upper bound on typos sent to a worker per task in parallel collision resolution
+_MAX_WORKER_CHUNKSIZE = 512
+
+# Below this many typos, starting workers (each builds both boundary indexes) costs
+# more than resolving the typos sequentially
+_MIN_PARALLEL_TYPOS = 256
+
+
+# Kind tags for _SingleWordResult, so a result carries one payload instead of
+# a slot per outcome
+_RESULT_NONE = 0  # No correction (e.g. rejected during boundary preparation)
+_RESULT_CORRECTION = 1  # payload: Correction
+_RESULT_EXCLUDED = 2  # payload: (typo, word, matching_rule)
+_RESULT_SKIPPED_SHORT = 3  # payload: (typo, word, len(typo))
 
-def _process_typo_worker(
-    item: tuple[str, list[str]],
-) -> tuple[
+# Type alias for the result of a single-word typo: (kind, payload, boundary_details)
+_SingleWordResult = tuple[int, Any, dict | None]
+
+# Type alias for the result of a collision typo
+_CollisionResult = tuple[
     list[Correction],  # corrections (can be multiple per typo now)
     list[tuple[str, str, str | None]],  # excluded_list
     list[tuple[str, list[str], float, BoundaryType]],  # skipped_collisions (now includes boundary)
-    list[tuple[str, str, int]],  # skipped_short_list
     list[dict],  # boundary_details_list
-]:
-    """Worker function to process a single typo collision.
+]
+
+
+def _process_single_word_worker(item: tuple[str, str]) -> _SingleWordResult:
+    """Worker function to process a typo that maps to a single word.
 
     Args:
-        item: Tuple of (typo, word_list)
+        item: Tuple of (typo, word)
 
     Returns:
-        Tuple of (corrections, excluded_list, skipped_collisions,
-            skipped_short_list, boundary_details_list)
-        - corrections: List of resolved corrections (can be multiple per typo, one per boundary)
-        - excluded_list: List of (typo, word, matching_rule) for excluded corrections
-        - skipped_collisions: List of (typo, words_in_group, ratio, boundary)
-            for ambiguous collisions
-        - skipped_short_list: List of (typo, word, len(typo)) for skipped short typos
-        - boundary_details_list: List of boundary details dicts for later logging
+        Tuple of (kind, payload, boundary_details)
+        - kind: One of the _RESULT_* tags
+        - payload: The correction, excluded info or skipped short info for kind,
+            None for _RESULT_NONE
+        - boundary_details: Boundary details dict for later logging, or None
     """
-    typo, word_list = item
+    typo, word = item
     context = get_collision_worker_context()
     validation_index, source_index = get_worker_indexes()
 
-    # Recreate ExclusionMatcher in worker (not serializable due to compiled regex)
-    exclusion_matcher = ExclusionMatcher(set(context.exclusion_set))
+    # Matchers and word sets are built once per worker in init_collision_worker
+    exclusion_matcher, debug_typo_matcher = get_worker_matchers()
+    user_words, debug_words = get_worker_word_sets()
 
-    # Recreate DebugTypoMatcher in worker from patterns (not serializable due to compiled regex)
-    debug_typo_matcher = (
-        DebugTypoMatcher.from_patterns(set(context.debug_typo_patterns))
-        if context.debug_typo_patterns
-        else None
+    # pylint: disable=duplicate-code
+    # False positive: Similar parameter lists are expected when calling the same function
+    # from different contexts (single-threaded vs parallel worker). This is not duplicate
+    # code that should be refactored - it's the same function call with the same parameters.
+    correction, was_skipped_short, excluded_info, boundary_details = process_single_word_correction(
+        typo,
+        word,
+        context.min_typo_length,
+        context.min_word_length,
+        user_words,
+        exclusion_matcher,
+        debug_words,
+        debug_typo_matcher,
+        validation_index,
+        source_index,
     )
 
-    # Convert frozensets back to sets for compatibility
-    user_words = set(context.user_words)
-    debug_words = set(context.debug_words)
+    boundary_details = boundary_details or None
+    if was_skipped_short:
+        return _RESULT_SKIPPED_SHORT, (typo, word, len(typo)), boundary_details
+    if excluded_info:
+        return _RESULT_EXCLUDED, excluded_info, boundary_details
+    if correction:
+        return _RESULT_CORRECTION, correction, boundary_details
+    return _RESULT_NONE, None, boundary_details
 
-    unique_words = list(set(word_list))
 
-    if len(unique_words) == 1:
-        # Single word case: no collision
-        word = unique_words[0]
+def _process_collision_worker(item: tuple[str, list[str]]) -> _CollisionResult:
+    """Worker function to process a typo that multiple words compete for.
 
-        # pylint: disable=duplicate-code
-        # False positive: Similar parameter lists are expected when calling the same function
-        # from different contexts (single-threaded vs parallel worker). This is not duplicate
-        # code that should be refactored - it's the same function call with the same parameters.
-        correction, was_skipped_short, excluded_info, boundary_details = (
-            process_single_word_correction(
-                typo,
-                word,
-                context.min_typo_length,
-                context.min_word_length,
-                user_words,
-                exclusion_matcher,
-                debug_words,
-                debug_typo_matcher,
-                validation_index,
-                source_index,
-            )
-        )
+    Args:
+        item: Tuple of (typo, unique_words)
+
+    Returns:
+        Tuple of (corrections, excluded_list, skipped_collisions, boundary_details_list)
+        - corrections: List of resolved corrections (can be multiple per typo, one per boundary)
+        - excluded_list: List of (typo, word, matching_rule) for excluded corrections
+        - skipped_collisions: List of (typo, words_in_group, ratio, boundary)
+            for ambiguous collisions
+        - boundary_details_list: List of boundary details dicts for later logging
+    """
+    typo, unique_words = item
+    context = get_collision_worker_context()
+    validation_index, source_index = get_worker_indexes()
+
+    # Matchers and word sets are built once per worker in init_collision_worker
+    exclusion_matcher, debug_typo_matcher = get_worker_matchers()
+    user_words, debug_words = get_worker_word_sets()
 
-        if was_skipped_short:
-            return (
-                [],
-                [],
-                [],
-                [(typo, word, len(typo))],
-                [boundary_details] if boundary_details else [],
-            )
-        if excluded_info:
-            return (
-                [],
-                [excluded_info],
-                [],
-                [],
-                [boundary_details] if boundary_details else [],
-            )
-        if correction:
-            return (
-                [correction],
-                [],
-                [],
-                [],
-                [boundary_details] if boundary_details else [],
-            )
-        return [], [], [], [], [boundary_details] if boundary_details else []
-
-    # Collision case: multiple words compete for same typo
     # pylint: disable=duplicate-code
     # False positive: This is a call to process_collision_case with standard parameters.
     # The similar code in correction_processor.py is the same function call with the same
@@ -134,7 +143,52 @@ def _process_typo_worker(
         source_index,
     )
 
-    return corrections, excluded_list, skipped_collisions, [], boundary_details_list
+    return corrections, excluded_list, skipped_collisions, boundary_details_list
+
+
+def _collect_single_word_results(
+    single_results: Iterable[_SingleWordResult],
+    final_corrections: list[Correction],
+    excluded_corrections: list[tuple[str, str, str | None]],
+    skipped_short: list[tuple[str, str, int]],
+    all_boundary_details: list[dict],
+    progress: BatchedProgress,
+) -> None:
+    """Sort tagged single-word results into the output lists."""
+    # Bind the append methods once, this loop runs once per single-word typo
+    append_correction = final_corrections.append
+    append_excluded = excluded_corrections.append
+    append_skipped_short = skipped_short.append
+    append_boundary_details = all_boundary_details.append
+    advance = progress.advance
+
+    for kind, payload, boundary_details in single_results:
+        if kind == _RESULT_CORRECTION:
+            append_correction(payload)
+        elif kind == _RESULT_EXCLUDED:
+            append_excluded(payload)
+        elif kind == _RESULT_SKIPPED_SHORT:
+            append_skipped_short(payload)
+        if boundary_details:
+            append_boundary_details(boundary_details)
+        advance()
+
+
+def _collect_collision_results(
+    collision_results: Iterable[_CollisionResult],
+    final_corrections: list[Correction],
+    excluded_corrections: list[tuple[str, str, str | None]],
+    skipped_collisions: list[tuple[str, list[str], float, BoundaryType]],
+    all_boundary_details: list[dict],
+    progress: BatchedProgress,
+) -> None:
+    """Merge collision results into the output lists."""
+    for corrections_list, excluded_list, skipped_collisions_list, details_list in collision_results:
+        final_corrections.extend(corrections_list)
+        excluded_corrections.extend(excluded_list)
+        skipped_collisions.extend(skipped_collisions_list)
+        all_boundary_details.extend(details_list)
+        progress.advance()
 
 
 def _process_parallel_collisions(
@@ -159,55 +213,59 @@ def _process_parallel_collisions(
     if verbose:
         logger.info(f"  Using {jobs} parallel workers")
         logger.info("  Preparing worker context...")
-        logger.info("  Initializing workers and building boundary indexes...")
+        logger.info("  Initializing workers...")
 
-    final_corrections = []
-    skipped_collisions = []
-    skipped_short = []
-    excluded_corrections = []
-    all_boundary_details = []
+    final_corrections: list[Correction] = []
+    skipped_collisions: list[tuple[str, list[str], float, BoundaryType]] = []
+    skipped_short: list[tuple[str, str, int]] = []
+    excluded_corrections: list[tuple[str, str, str | None]] = []
+    all_boundary_details: list[dict] = []
 
     with Pool(processes=jobs, initializer=init_collision_worker, initargs=(context,)) as pool:
-        items = list(typo_map.items())
-        results = pool.imap_unordered(_process_typo_worker, items)
+        total = len(typo_map)
+        # Send typos to workers in chunks to cut per-task IPC overhead, keeping
+        # ~4 chunks per worker so the tail still balances across workers
+        chunksize = max(1, min(_MAX_WORKER_CHUNKSIZE, total // (jobs * 4)))
 
-        # Wrap with progress bar if verbose
+        progress_bar: Any = None
         if verbose:
-            results_wrapped_iter: Any = tqdm(
-                results, total=len(items), desc="Resolving collisions", unit="typo"
-            )
-        else:
-            results_wrapped_iter = results
-
-        for (
-            corrections_list,
-            excluded_list,
-            skipped_collisions_list,
-            skipped_short_list,
-            boundary_details_list,
-        ) in results_wrapped_iter:
-            # Accumulate all results
-            final_corrections.extend(corrections_list)
-            excluded_corrections.extend(excluded_list)
-            skipped_collisions.extend(skipped_collisions_list)
-            skipped_short.extend(skipped_short_list)
-            all_boundary_details.extend(boundary_details_list)
+            progress_bar = tqdm(total=total, desc="Resolving collisions", unit="typo")
+
+        # Single-word typos stream straight from typo_map. Collisions are collected
+        # while the pool consumes that stream.
+        collision_items: list[tuple[str, list[str]]] = []
+        single_results = pool.imap_unordered(
+            _process_single_word_worker,
+            _iter_single_word_items(typo_map, collision_items),
+            chunksize=chunksize,
+        )
+
+        # The progress bar is advanced once per chunk so the loop keeps up with workers
+        progress = BatchedProgress(progress_bar, chunksize)
+        _collect_single_word_results(
+            single_results,
+            final_corrections,
+            excluded_corrections,
+            skipped_short,
+            all_boundary_details,
+            progress,
+        )
+
+        # imap_unordered only finishes once its input is exhausted, so every
+        # collision has been collected by now
+        _collect_collision_results(
+            pool.imap_unordered(_process_collision_worker, collision_items, chunksize=chunksize),
+            final_corrections,
+            excluded_corrections,
+            skipped_collisions,
+            all_boundary_details,
+            progress,
+        )
+        progress.close()
 
         # Log boundary selection details AFTER processing completes
         if all_boundary_details and debug_typo_matcher:
-            # pylint: disable=duplicate-code
-            # Acceptable pattern: This is a function call to log_boundary_selection_details.
-            # The similar code in collision_helpers.py calls the same function with the
-            # same parameters. This is expected when both places need to log boundary
-            # details in the same way.
-            for bd in all_boundary_details:
-                log_boundary_selection_details(
-                    bd["typo"],
-                    bd["word"],
-                    BoundaryType(bd["boundary"]),
-                    bd["details"],
-                    debug_typo_matcher,
-                )
+            _log_boundary_details(all_boundary_details, debug_typo_matcher)
 
     return final_corrections, skipped_collisions, skipped_short, excluded_corrections
 
@@ -248,18 +306,11 @@ def _process_single_threaded_collisions(
     validation_index = BoundaryIndex(validation_set)
     source_index = BoundaryIndex(source_words)
 
-    # Wrap with progress bar if verbose
+    collision_items: list[tuple[str, list[str]]] = []
+
+    progress_bar: Any = None
     if verbose:
-        items_iter: list[tuple[str, list[str]]] = list(
-            tqdm(
-                typo_map.items(),
-                total=len(typo_map),
-                desc="Resolving collisions",
-                unit="typo",
-            )
-        )
-    else:
-        items_iter = list(typo_map.items())
+        progress_bar = tqdm(total=len(typo_map), desc="Resolving collisions", unit="typo")
 
     final_corrections: list[Correction] = []
     skipped_collisions: list[tuple[str, list[str], float, BoundaryType]] = []
@@ -269,52 +320,57 @@ def _process_single_threaded_collisions(
     if exclusion_matcher is None:
         exclusion_matcher = ExclusionMatcher(set())
 
-    for typo, word_list in items_iter:
-        unique_words = list(set(word_list))
-
-        if len(unique_words) == 1:
-            # pylint: disable=duplicate-code
-            # Acceptable pattern: This is a function call to a wrapper function with
-            # standard parameters. The similar code in collision_helpers.py calls a
-            # different wrapper function (_process_single_word_case). The similar
-            # parameter lists are expected when calling related wrapper functions.
-            _process_single_word_item(
-                typo,
-                unique_words,
-                min_typo_length,
-                min_word_length,
-                user_words,
-                exclusion_matcher,
-                debug_words,
-                debug_typo_matcher,
-                validation_index,
-                source_index,
-                final_corrections,
-                skipped_short,
-                excluded_corrections,
-            )
-        else:
-            # pylint: disable=duplicate-code
-            # Acceptable pattern: This is a function call to a wrapper function with
-            # standard parameters. The similar code in collision_helpers.py calls a
-            # different wrapper function (_process_collision_case_wrapper). The similar
-            # parameter lists are expected when calling related wrapper functions.
-            _process_collision_item(
-                typo,
-                unique_words,
-                freq_ratio,
-                min_typo_length,
-                min_word_length,
-                user_words,
-                exclusion_matcher,
-                debug_words,
-                debug_typo_matcher,
-                validation_index,
-                source_index,
-                final_corrections,
-                excluded_corrections,
-                skipped_collisions,
-            )
+    for typo, word in _iter_single_word_items(typo_map, collision_items):
+        # pylint: disable=duplicate-code
+        # Acceptable pattern: This is a function call to a wrapper function with
+        # standard parameters. The similar code in collision_helpers.py calls a
+        # different wrapper function (_process_single_word_case). The similar
+        # parameter lists are expected when calling related wrapper functions.
+        _process_single_word_item(
+            typo,
+            word,
+            min_typo_length,
+            min_word_length,
+            user_words,
+            exclusion_matcher,
+            debug_words,
+            debug_typo_matcher,
+            validation_index,
+            source_index,
+            final_corrections,
+            skipped_short,
+            excluded_corrections,
+        )
+        if progress_bar:
+            progress_bar.update(1)
+
+    for typo, unique_words in collision_items:
+        # pylint: disable=duplicate-code
+        # Acceptable pattern: This is a function call to a wrapper function with
+        # standard parameters. The similar code in collision_helpers.py calls a
+        # different wrapper function (_process_collision_case_wrapper). The similar
+        # parameter lists are expected when calling related wrapper functions.
+        _process_collision_item(
+            typo,
+            unique_words,
+            freq_ratio,
+            min_typo_length,
+            min_word_length,
+            user_words,
+            exclusion_matcher,
+            debug_words,
+            debug_typo_matcher,
+            validation_index,
+            source_index,
+            final_corrections,
+            excluded_corrections,
+            skipped_collisions,
+        )
+        if progress_bar:
+            progress_bar.update(1)
+
+    if progress_bar:
+        progress_bar.close()
 
     return final_corrections, skipped_collisions, skipped_short, excluded_corrections
 
@@ -367,21 +423,16 @@ def resolve_collisions(
         # This should only happen in single-threaded mode
         exclusion_set = set()
 
-    if debug_words is None:
-        debug_words = set()
-
-    if debug_typo_patterns is None:
-        debug_typo_patterns = set()
-
-    if exclusion_set is None:
-        exclusion_set = set()
-
-    if jobs > 1 and len(typo_map) > 1:
+    if jobs > 1 and len(typo_map) >= _MIN_PARALLEL_TYPOS:
         # Parallel processing mode
         # Create context for workers
+        if verbose:
+            logger.info("  Building boundary indexes...")
+        validation_frozen = frozenset(validation_set)
+        source_frozen = frozenset(source_words)
         context = CollisionResolutionContext(
-            validation_set=frozenset(validation_set),
-            source_words=frozenset(source_words),
+            validation_set=validation_frozen,
+            source_words=source_frozen,
             freq_ratio=freq_ratio,
             min_typo_length=min_typo_length,
             min_word_length=min_word_length,
@@ -389,6 +440,8 @@ def resolve_collisions(
             exclusion_set=frozenset(exclusion_set),
             debug_words=frozenset(debug_words),
             debug_typo_patterns=frozenset(debug_typo_patterns),
+            validation_index=BoundaryIndex(validation_frozen),
+            source_index=BoundaryIndex(source_frozen),
         )
         return _process_parallel_collisions(typo_map, context, jobs, verbose, debug_typo_matcher)
 
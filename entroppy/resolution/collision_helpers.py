@@ -1,6 +1,8 @@
 """Helper functions for collision resolution."""
 
-from entroppy.core import BoundaryType, Correction
+from collections.abc import Iterator
+
+from entroppy.core import Correction
 from entroppy.core.boundaries import BoundaryIndex
 from entroppy.matching import ExclusionMatcher
 from entroppy.resolution.boundaries.selection import log_boundary_selection_details
@@ -8,9 +10,40 @@ from entroppy.resolution.processing import process_collision_case, process_singl
 from entroppy.utils.debug import DebugTypoMatcher
 
 
+def _iter_single_word_items(
+    typo_map: dict[str, list[str]],
+    collision_items: list[tuple[str, list[str]]],
+) -> Iterator[tuple[str, str]]:
+    """Yield single-word typos from a typo map, collecting collisions on the side.
+
+    Walks typo_map lazily, so the (mostly single-word) items are never copied
+    into a list of their own.
+
+    Args:
+        typo_map: Map of typos to word lists
+        collision_items: List that receives (typo, unique_words) for each typo with
+            several distinct words. Complete once the iterator is exhausted.
+
+    Yields:
+        (typo, word) for each typo with one distinct word
+    """
+    for typo, word_list in typo_map.items():
+        # Most typos come from a single word, so skip building a set for them
+        if len(word_list) == 1:
+            yield typo, word_list[0]
+            continue
+        # dict.fromkeys keeps the words in first-seen order, so collisions are
+        # resolved the same way on every run
+        unique_words = dict.fromkeys(word_list)
+        if len(unique_words) == 1:
+            yield typo, word_list[0]
+        else:
+            collision_items.append((typo, list(unique_words)))
+
+
 def _process_single_word_item(
     typo: str,
-    unique_words: list[str],
+    word: str,
     min_typo_length: int,
     min_word_length: int,
     user_words: set[str],
@@ -31,7 +64,7 @@ def _process_single_word_item(
     # related wrapper functions.
     correction, was_skipped_short, excluded_info = _process_single_word_case(
         typo,
-        unique_words,
+        word,
         min_typo_length,
         min_word_length,
         user_words,
@@ -43,7 +76,7 @@ def _process_single_word_item(
     )
 
     if was_skipped_short:
-        skipped_short.append((typo, unique_words[0], len(typo)))
+        skipped_short.append((typo, word, len(typo)))
     elif excluded_info:
         excluded_corrections.append(excluded_info)
     elif correction:
@@ -100,7 +133,7 @@ def _process_collision_item(
 
 def _process_single_word_case(
     typo: str,
-    unique_words: list[str],
+    word: str,
     min_typo_length: int,
     min_word_length: int,
     user_words: set[str],
@@ -111,7 +144,6 @@ def _process_single_word_case(
     source_index: BoundaryIndex,
 ) -> tuple[Correction | None, bool, tuple | None]:
     """Process single word case (no collision)."""
-    word = unique_words[0]
     # pylint: disable=duplicate-code
     # Acceptable pattern: This is a function call to process_single_word_correction
     # with standard parameters. The similar code in collision.py calls
@@ -182,7 +214,7 @@ def _log_boundary_details(
         log_boundary_selection_details(
             bd["typo"],
             bd["word"],
-            BoundaryType(bd["boundary"]),
+            bd["boundary"],
             bd["details"],
             debug_typo_matcher,
         )
@@ -1,15 +1,16 @@
 """False trigger checking logic for boundary selection."""
 
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
 from tqdm import tqdm
 
 from entroppy.core import BoundaryType
 from entroppy.core.boundaries import (
+    TRIGGER_END,
+    TRIGGER_START,
+    TRIGGER_SUBSTRING,
     BoundaryIndex,
-    is_substring_of_any,
-    would_trigger_at_end,
-    would_trigger_at_start,
 )
 from entroppy.core.boundaries.detection import _batch_check_substrings
 
@@ -18,6 +19,36 @@ from .boundaries.utils import _check_typo_in_target_word
 if TYPE_CHECKING:
     pass
 
+# Module-level aliases so hot paths skip the BoundaryType attribute lookup. Enum
+# members are singletons, so hot paths compare them by identity
+_B_NONE = BoundaryType.NONE
+_B_LEFT = BoundaryType.LEFT
+_B_RIGHT = BoundaryType.RIGHT
+_B_BOTH = BoundaryType.BOTH
+
+
+@dataclass(slots=True)
+class FalseTriggerDetails:
+    """Details of a false trigger check, for debug logging.
+
+    Combined flags merge the target word, validation and source checks; the
+    _target/_val/_src flags hold each check on its own.
+    """
+
+    reason: str | None
+    would_trigger_start: bool
+    would_trigger_end: bool
+    is_substring: bool
+    would_trigger_start_target: bool
+    would_trigger_end_target: bool
+    is_substring_target: bool
+    would_trigger_start_val: bool
+    would_trigger_end_val: bool
+    is_substring_val: bool
+    would_trigger_start_src: bool
+    would_trigger_end_src: bool
+    is_substring_src: bool
+
 
 def _determine_none_boundary_reason(
     would_trigger_start_target: bool,
@@ -75,7 +106,7 @@ def _determine_false_trigger_for_boundary(
     Returns:
         Tuple of (would_cause, reason)
     """
-    if boundary == BoundaryType.NONE:
+    if boundary is _B_NONE:
         # NONE matches anywhere, so false trigger if typo appears anywhere
         would_cause = would_trigger_start or would_trigger_end or is_substring
         reason = (
@@ -93,15 +124,15 @@ def _determine_false_trigger_for_boundary(
             if would_cause
             else None
         )
-    elif boundary == BoundaryType.LEFT:
+    elif boundary is _B_LEFT:
         # LEFT matches at word start, so false trigger if typo appears as prefix
         would_cause = would_trigger_start
         reason = "typo appears as prefix" if would_cause else None
-    elif boundary == BoundaryType.RIGHT:
+    elif boundary is _B_RIGHT:
         # RIGHT matches at word end, so false trigger if typo appears as suffix
         would_cause = would_trigger_end
         reason = "typo appears as suffix" if would_cause else None
-    elif boundary == BoundaryType.BOTH:
+    elif boundary is _B_BOTH:
         # BOTH matches as standalone word only, so it would NOT cause false triggers
         would_cause = False
         reason = None
@@ -113,6 +144,112 @@ def _determine_false_trigger_for_boundary(
     return would_cause, reason
 
 
+def _batch_entry_to_masks(batch: dict[str, bool]) -> tuple[int, int]:
+    """Convert a batch false trigger result into (validation_mask, source_mask)."""
+    val_mask = (
+        (TRIGGER_START if batch.get("start_val", False) else 0)
+        | (TRIGGER_END if batch.get("end_val", False) else 0)
+        | (TRIGGER_SUBSTRING if batch.get("substring_val", False) else 0)
+    )
+    src_mask = (
+        (TRIGGER_START if batch.get("start_src", False) else 0)
+        | (TRIGGER_END if batch.get("end_src", False) else 0)
+        | (TRIGGER_SUBSTRING if batch.get("substring_src", False) else 0)
+    )
+    return val_mask, src_mask
+
+
+def _get_trigger_masks(
+    typo: str,
+    validation_index: BoundaryIndex,
+    source_index: BoundaryIndex,
+    batch_results: dict[str, dict[str, bool]] | None,
+) -> tuple[int, int]:
+    """Get the validation and source trigger masks for a typo.
+
+    Uses batch results if available, otherwise the precomputed per-index
+    trigger masks (one dict lookup per index).
+
+    Returns:
+        Tuple of (validation_mask, source_mask) made of TRIGGER_* bit flags
+    """
+    if batch_results and typo in batch_results:
+        return _batch_entry_to_masks(batch_results[typo])
+    return validation_index.trigger_mask.get(typo, 0), source_index.trigger_mask.get(typo, 0)
+
+
+def _would_cause_false_trigger(
+    typo: str,
+    boundary: BoundaryType,
+    validation_index: BoundaryIndex,
+    source_index: BoundaryIndex,
+    target_word: str | None = None,
+    batch_results: dict[str, dict[str, bool]] | None = None,
+    target_bits: tuple[bool, bool, bool] | None = None,
+) -> bool:
+    """Check if boundary would cause false triggers, without building details.
+
+    Fast path for callers that only need the verdict. Only the checks the given
+    boundary depends on are evaluated: BOTH needs none, LEFT only the prefix
+    checks, RIGHT only the suffix checks, and NONE any occurrence at all.
+
+    Args:
+        typo: The typo string
+        boundary: The boundary type to check
+        validation_index: Boundary index for validation set
+        source_index: Boundary index for source words
+        target_word: Optional target word to check against
+        batch_results: Optional pre-computed batch results (see
+            _check_false_trigger_with_details)
+        target_bits: Optional precomputed _check_typo_in_target_word(typo, target_word)
+            result (see _check_false_trigger_with_details)
+
+    Returns:
+        True if the boundary would cause false triggers
+    """
+    if boundary is _B_BOTH:
+        return False
+
+    val_mask, src_mask = _get_trigger_masks(typo, validation_index, source_index, batch_results)
+    if target_bits is None:
+        target_bits = _check_typo_in_target_word(typo, target_word)
+    return _would_cause_false_trigger_for_mask(boundary, val_mask | src_mask, target_bits)
+
+
+def _would_cause_false_trigger_for_mask(
+    boundary: BoundaryType,
+    mask: int,
+    target_bits: tuple[bool, bool, bool],
+) -> bool:
+    """Check if boundary would cause false triggers given already combined checks.
+
+    Lets batch callers look a typo's mask up once and reuse it for every
+    boundary and target word.
+
+    Args:
+        boundary: The boundary type to check
+        mask: Validation and source TRIGGER_* bit flags OR-ed together
+        target_bits: Target word check as (is_prefix, is_suffix, is_middle), see
+            _check_typo_in_target_word
+
+    Returns:
+        True if the boundary would cause false triggers
+    """
+    if boundary is _B_BOTH:
+        return False
+
+    target_is_prefix, target_is_suffix, target_is_middle = target_bits
+
+    if boundary is _B_NONE:
+        return bool(mask) or target_is_prefix or target_is_suffix or target_is_middle
+    if boundary is _B_LEFT:
+        return bool(mask & TRIGGER_START) or target_is_prefix
+    if boundary is _B_RIGHT:
+        return bool(mask & TRIGGER_END) or target_is_suffix
+    # Unknown boundary type, be conservative
+    return True
+
+
 def _check_false_trigger_with_details(
     typo: str,
     boundary: BoundaryType,
@@ -120,7 +257,8 @@ def _check_false_trigger_with_details(
     source_index: BoundaryIndex,
     target_word: str | None = None,
     batch_results: dict[str, dict[str, bool]] | None = None,
-) -> tuple[bool, dict[str, bool | str | None]]:
+    target_bits: tuple[bool, bool, bool] | None = None,
+) -> tuple[bool, FalseTriggerDetails]:
     """Check if boundary would cause false triggers and return details.
 
     This helper function eliminates duplication between boundary_selection.py
@@ -134,32 +272,24 @@ def _check_false_trigger_with_details(
         target_word: Optional target word to check against
         batch_results: Optional pre-computed batch results dict with keys:
             'start_val', 'end_val', 'substring_val', 'start_src', 'end_src', 'substring_src'
+        target_bits: Optional precomputed _check_typo_in_target_word(typo, target_word)
+            result, so callers checking several boundaries compute it only once
 
     Returns:
-        Tuple of (would_cause_false_trigger, details_dict)
+        Tuple of (would_cause_false_trigger, details)
     """
-    # Use batch results if available, otherwise compute individually
-    if batch_results and typo in batch_results:
-        batch = batch_results[typo]
-        would_trigger_start_val = batch.get("start_val", False)
-        would_trigger_end_val = batch.get("end_val", False)
-        is_substring_val = batch.get("substring_val", False)
-        would_trigger_start_src = batch.get("start_src", False)
-        would_trigger_end_src = batch.get("end_src", False)
-        is_substring_src = batch.get("substring_src", False)
-    else:
-        # Fallback to individual checks
-        would_trigger_start_val = would_trigger_at_start(typo, validation_index)
-        would_trigger_end_val = would_trigger_at_end(typo, validation_index)
-        is_substring_val = is_substring_of_any(typo, validation_index)
-        would_trigger_start_src = would_trigger_at_start(typo, source_index)
-        would_trigger_end_src = would_trigger_at_end(typo, source_index)
-        is_substring_src = is_substring_of_any(typo, source_index)
+    val_mask, src_mask = _get_trigger_masks(typo, validation_index, source_index, batch_results)
+    would_trigger_start_val = bool(val_mask & TRIGGER_START)
+    would_trigger_end_val = bool(val_mask & TRIGGER_END)
+    is_substring_val = bool(val_mask & TRIGGER_SUBSTRING)
+    would_trigger_start_src = bool(src_mask & TRIGGER_START)
+    would_trigger_end_src = bool(src_mask & TRIGGER_END)
+    is_substring_src = bool(src_mask & TRIGGER_SUBSTRING)
 
     # Check target word (always done individually as it's per-typo)
-    would_trigger_start_target, would_trigger_end_target, is_substring_target = (
-        _check_typo_in_target_word(typo, target_word)
-    )
+    if target_bits is None:
+        target_bits = _check_typo_in_target_word(typo, target_word)
+    would_trigger_start_target, would_trigger_end_target, is_substring_target = target_bits
 
     # Combine checks: target word check takes precedence
     would_trigger_start = (
@@ -185,22 +315,21 @@ def _check_false_trigger_with_details(
         is_substring_src,
     )
 
-    details = {
-        "would_cause_false_trigger": would_cause,
-        "reason": reason,
-        "would_trigger_start": would_trigger_start,
-        "would_trigger_end": would_trigger_end,
-        "is_substring": is_substring,
-        "would_trigger_start_target": would_trigger_start_target,
-        "would_trigger_end_target": would_trigger_end_target,
-        "is_substring_target": is_substring_target,
-        "would_trigger_start_val": would_trigger_start_val,
-        "would_trigger_end_val": would_trigger_end_val,
-        "is_substring_val": is_substring_val,
-        "would_trigger_start_src": would_trigger_start_src,
-        "would_trigger_end_src": would_trigger_end_src,
-        "is_substring_src": is_substring_src,
-    }
+    details = FalseTriggerDetails(
+        reason=reason,
+        would_trigger_start=would_trigger_start,
+        would_trigger_end=would_trigger_end,
+        is_substring=is_substring,
+        would_trigger_start_target=would_trigger_start_target,
+        would_trigger_end_target=would_trigger_end_target,
+        is_substring_target=is_substring_target,
+        would_trigger_start_val=would_trigger_start_val,
+        would_trigger_end_val=would_trigger_end_val,
+        is_substring_val=is_substring_val,
+        would_trigger_start_src=would_trigger_start_src,
+        would_trigger_end_src=would_trigger_end_src,
+        is_substring_src=is_substring_src,
+    )
     return would_cause, details
 
 
@@ -1,9 +1,8 @@
 """History tracking data models for debug reports."""
 
+from dataclasses import dataclass
 from enum import Enum
 
-from pydantic import BaseModel
-
 from entroppy.core import BoundaryType
 
 
@@ -19,7 +18,10 @@ class RejectionReason(Enum):
     FALSE_TRIGGER = "false_trigger"
 
 
-class GraveyardHistoryEntry(BaseModel):
+# Written once per event and only read afterwards, so a slotted frozen dataclass
+# avoids per-instance validation and __dict__ overhead
+@dataclass(frozen=True, slots=True, kw_only=True)
+class GraveyardHistoryEntry:
     """Complete history of a graveyard entry."""
 
     iteration: int
@@ -32,11 +34,12 @@ class GraveyardHistoryEntry(BaseModel):
     timestamp: float  # For ordering within same iteration/pass
 
 
-class PatternHistoryEntry(BaseModel):
+@dataclass(frozen=True, slots=True, kw_only=True)
+class PatternHistoryEntry:
     """Complete history of pattern lifecycle."""
 
     # pylint: disable=duplicate-code
-    # Acceptable pattern: These are Pydantic model field definitions representing the data model.
+    # Acceptable pattern: These are dataclass field definitions representing the data model.
     # The similar field structure in CorrectionHistoryEntry and DebugTraceEntry is inherent
     # to the domain model (all track similar lifecycle events). This is structural similarity,
     # not logic duplication. Extracting would require complex inheritance hierarchies that
@@ -51,11 +54,12 @@ class PatternHistoryEntry(BaseModel):
     timestamp: float
 
 
-class CorrectionHistoryEntry(BaseModel):
+@dataclass(frozen=True, slots=True, kw_only=True)
+class CorrectionHistoryEntry:
     """Complete history of correction lifecycle."""
 
     # pylint: disable=duplicate-code
-    # Acceptable pattern: These are Pydantic model field definitions representing
+    # Acceptable pattern: These are dataclass field definitions representing
     # the data model. The similar field structure in SolverEventEntry Protocol is
     # inherent to the domain model (both track similar lifecycle events). This is
     # structural similarity, not logic duplication.
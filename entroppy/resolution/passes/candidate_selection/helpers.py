@@ -1,7 +1,5 @@
 """Helper functions for candidate selection."""
 
-from collections import defaultdict
-
 from entroppy.core import BoundaryType
 
 
@@ -11,8 +9,8 @@ def group_words_by_boundary(
 ) -> dict[BoundaryType, list[str]]:
     """Group words by boundary type.
 
-    This helper function extracts the common pattern of creating a word_boundary_map
-    and grouping words by boundary type.
+    In candidate selection all words for the same typo have the same boundary, so
+    this is a single group holding every word.
 
     Args:
         unique_words: List of unique words
@@ -20,20 +18,31 @@ def group_words_by_boundary(
             for the same typo have the same boundary)
 
     Returns:
-        Dictionary mapping boundary type to list of words with that boundary
+        Dictionary mapping boundary type to list of words with that boundary. The
+        list is unique_words itself, not a copy. Empty if unique_words is empty.
     """
-    # All words for the same typo will have the same boundary
-    word_boundary_map = {word: boundary for word in unique_words}
-
-    # Group words by boundary type
-    by_boundary = defaultdict(list)
-    for word, word_boundary in word_boundary_map.items():
-        by_boundary[word_boundary].append(word)
-
-    return by_boundary
+    if not unique_words:
+        return {}
+    return {boundary: unique_words}
+
+
+# Boundaries to try for each natural boundary: natural first, then stricter alternatives
+_BOUNDARY_ORDER: dict[BoundaryType, tuple[BoundaryType, ...]] = {
+    # NONE is least strict - try all others if it fails
+    BoundaryType.NONE: (
+        BoundaryType.NONE,
+        BoundaryType.LEFT,
+        BoundaryType.RIGHT,
+        BoundaryType.BOTH,
+    ),
+    BoundaryType.LEFT: (BoundaryType.LEFT, BoundaryType.BOTH),
+    BoundaryType.RIGHT: (BoundaryType.RIGHT, BoundaryType.BOTH),
+    # BOTH is most strict - only try it
+    BoundaryType.BOTH: (BoundaryType.BOTH,),
+}
 
 
-def _get_boundary_order(natural_boundary: BoundaryType) -> list[BoundaryType]:
+def _get_boundary_order(natural_boundary: BoundaryType) -> tuple[BoundaryType, ...]:
     """Get the order of boundaries to try, starting with the natural one.
 
     This implements self-healing: if a less strict boundary fails,
@@ -43,20 +52,6 @@ def _get_boundary_order(natural_boundary: BoundaryType) -> list[BoundaryType]:
         natural_boundary: The naturally determined boundary
 
     Returns:
-        List of boundaries to try in order
+        Shared tuple of boundaries to try in order
     """
-    # Order: try natural first, then stricter alternatives
-    if natural_boundary == BoundaryType.NONE:
-        # NONE is least strict - try all others if it fails
-        return [
-            BoundaryType.NONE,
-            BoundaryType.LEFT,
-            BoundaryType.RIGHT,
-            BoundaryType.BOTH,
-        ]
-    if natural_boundary == BoundaryType.LEFT:
-        return [BoundaryType.LEFT, BoundaryType.BOTH]
-    if natural_boundary == BoundaryType.RIGHT:
-        return [BoundaryType.RIGHT, BoundaryType.BOTH]
-    # BOTH is most strict - only try it
-    return [BoundaryType.BOTH]
+    return _BOUNDARY_ORDER[natural_boundary]
@@ -123,8 +123,9 @@ class CandidateSelectionPass(Pass):
             typos_iter = typos_to_process
 
         for typo, word_list in typos_iter:
-            # Get unique words for this typo
-            unique_words = list(set(word_list))
+            # Get unique words for this typo. Most typos come from one word, so skip
+            # deduplicating those; dict.fromkeys keeps the words in first-seen order
+            unique_words = word_list if len(word_list) == 1 else list(dict.fromkeys(word_list))
 
             # Process based on number of words
             if len(unique_words) == 1:
@@ -297,8 +298,7 @@ class CandidateSelectionPass(Pass):
         )
         if would_cause:
             # This boundary would cause false triggers - add to graveyard
-            reason_value = details.get("reason", "false trigger")
-            reason_str = reason_value if isinstance(reason_value, str) else "false trigger"
+            reason_str = details.reason or "false trigger"
             state.add_to_graveyard(
                 typo,
                 word,
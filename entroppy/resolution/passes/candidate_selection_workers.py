@@ -5,12 +5,17 @@ from typing import TYPE_CHECKING
 from entroppy.core import BoundaryType
 from entroppy.core.types import Correction
 from entroppy.matching import ExclusionMatcher
-from entroppy.resolution.false_trigger_check import _check_false_trigger_with_details
+from entroppy.resolution.boundaries.utils import _check_typo_in_target_word
+from entroppy.resolution.false_trigger_check import (
+    _check_false_trigger_with_details,
+    _would_cause_false_trigger,
+)
 from entroppy.resolution.state import RejectionReason
 from entroppy.resolution.worker_context import (
     CandidateSelectionContext,
     get_candidate_selection_worker_context,
     get_candidate_worker_indexes,
+    get_exclusion_matcher,
 )
 from entroppy.utils.helpers import cached_word_frequency
 
@@ -97,8 +102,7 @@ def _process_single_word_worker(
         )
         if would_cause:
             # This boundary would cause false triggers - add to graveyard and try next boundary
-            reason_value = details.get("reason", "false trigger")
-            reason_str = reason_value if isinstance(reason_value, str) else "false trigger"
+            reason_str = details.reason or "false trigger"
             graveyard_entries.append(
                 (typo, word, boundary, RejectionReason.FALSE_TRIGGER, reason_str)
             )
@@ -135,6 +139,8 @@ def _process_single_word_with_boundary_worker(
     """
     # Try boundaries in order starting from the given boundary
     boundaries_to_try = _get_boundary_order(boundary)
+    # Same for every boundary tried, so check the target word once
+    target_bits = _check_typo_in_target_word(typo, word)
 
     for bound in boundaries_to_try:
         # Check if this is in the graveyard
@@ -156,13 +162,14 @@ def _process_single_word_with_boundary_worker(
         # Intentional duplication: Same false trigger check pattern used in multiple places
         # (worker functions, sequential functions, and boundary_selection.py) to ensure
         # consistent validation logic across all code paths where corrections are added.
-        would_cause, _ = _check_false_trigger_with_details(
+        would_cause = _would_cause_false_trigger(
             typo,
             bound,
             validation_index,
             source_index,
             target_word=word,
             batch_results=context.batch_false_trigger_results,
+            target_bits=target_bits,
         )
         if would_cause:
             # This boundary would cause false triggers - try next boundary
@@ -222,6 +229,8 @@ def _try_boundaries_for_correction(
 ) -> None:
     """Try boundaries in order to find a valid correction."""
     boundaries_to_try = _get_boundary_order(boundary)
+    # Same for every boundary tried, so check the target word once
+    target_bits = _check_typo_in_target_word(typo, word)
 
     for bound in boundaries_to_try:
         # Check if this is in the graveyard
@@ -243,13 +252,14 @@ def _try_boundaries_for_correction(
         # Intentional duplication: Same false trigger check pattern used in multiple places
         # (worker functions, sequential functions, and boundary_selection.py) to ensure
         # consistent validation logic across all code paths where corrections are added.
-        would_cause, _ = _check_false_trigger_with_details(
+        would_cause = _would_cause_false_trigger(
             typo,
             bound,
             validation_index,
             source_index,
             target_word=word,
             batch_results=context.batch_false_trigger_results,
+            target_bits=target_bits,
         )
         if would_cause:
             # This boundary would cause false triggers - try next boundary
@@ -392,9 +402,10 @@ def _process_typo_batch_worker(
         )
     validation_index, source_index = indexes
 
-    # Recreate ExclusionMatcher in worker (not serializable due to compiled regex)
+    # ExclusionMatcher isn't serializable (compiled regex), so the worker builds it
+    # once and reuses it for every batch
     exclusion_matcher = (
-        ExclusionMatcher(set(context.exclusion_set)) if context.exclusion_set else None
+        get_exclusion_matcher(context.exclusion_set) if context.exclusion_set else None
     )
 
     corrections: list[Correction] = []
@@ -405,8 +416,9 @@ def _process_typo_batch_worker(
         if typo in context.covered_typos:
             continue
 
-        # Get unique words for this typo
-        unique_words = list(set(word_list))
+        # Get unique words for this typo. Most typos come from one word, so skip
+        # deduplicating those; dict.fromkeys keeps the words in first-seen order
+        unique_words = word_list if len(word_list) == 1 else list(dict.fromkeys(word_list))
 
         # Process based on number of words
         if len(unique_words) == 1:
@@ -17,10 +17,12 @@ def process_conflict_combinations(
     shorter_corrections: list[tuple[tuple[str, str, BoundaryType], str, BoundaryType]],
     longer_corrections: list[tuple[tuple[str, str, BoundaryType], str, BoundaryType]],
     match_direction: MatchDirection,
-    processed_pairs: set[frozenset[tuple[str, str, BoundaryType]]],
+    processed_pairs: (
+        set[tuple[tuple[str, str, BoundaryType], tuple[str, str, BoundaryType]]] | None
+    ),
     corrections_to_remove_set: set[tuple[str, str, BoundaryType]],
     all_corrections_to_remove: list[tuple[tuple[str, str, BoundaryType], str]],
-    all_conflict_pairs: dict[tuple[str, str, BoundaryType], tuple[str, str, BoundaryType]],
+    all_conflict_pairs: dict[tuple[str, str, BoundaryType], tuple[str, str, BoundaryType]] | None,
     validation_index: "BoundaryIndex | None",
     source_index: "BoundaryIndex | None",
     debug_words: set[str] | None,
@@ -34,10 +36,11 @@ def process_conflict_combinations(
         shorter_corrections: Corrections for the shorter typo
         longer_corrections: Corrections for the longer typo
         match_direction: Platform match direction
-        processed_pairs: Set of already processed correction pairs
+        processed_pairs: Set of already processed correction pairs, or None to skip
+            pair deduplication
         corrections_to_remove_set: Set of corrections already marked for removal
         all_corrections_to_remove: List to append removals to
-        all_conflict_pairs: Dict to update with conflict pairs
+        all_conflict_pairs: Dict to update with conflict pairs, or None to skip recording
         validation_index: Optional boundary index for validation set
         source_index: Optional boundary index for source words
         debug_words: Optional set of words to debug
@@ -51,13 +54,7 @@ def process_conflict_combinations(
             if correction2 in corrections_to_remove_set:
                 continue
 
-            # Check if we've already processed this pair
-            pair_key = frozenset({correction1, correction2})
-            if pair_key in processed_pairs:
-                continue
-            processed_pairs.add(pair_key)
-
-            # Process conflict pair
+            # Process conflict pair (it skips and records already processed pairs)
             # pylint: disable=duplicate-code
             # Acceptable pattern: This is a function call to process_conflict_pair
             # with standard parameters. The similar code in utils.py calls the
@@ -81,9 +78,11 @@ def process_conflict_combinations(
             # need to process conflict pairs.
 
             if result is not None:
+                # process_conflict_pair skips corrections already in the set, so
+                # recording each removal here keeps the list free of duplicates
                 correction_to_remove, reason = result
+                corrections_to_remove_set.add(correction_to_remove)
                 all_corrections_to_remove.append((correction_to_remove, reason))
-                if conflict_pair is not None:
+                if conflict_pair is not None and all_conflict_pairs is not None:
                     removed_correction, conflicting_correction = conflict_pair
                     all_conflict_pairs[removed_correction] = conflicting_correction
-                    corrections_to_remove_set.add(correction_to_remove)
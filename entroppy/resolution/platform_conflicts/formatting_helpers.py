@@ -1,42 +1,33 @@
 """Helper functions for formatting corrections in platform substring conflict pass."""
 
 from collections import defaultdict
-from multiprocessing import Pool
-from typing import TYPE_CHECKING, Any, Callable
+from typing import Any, Callable
 
 from tqdm import tqdm
 
 from entroppy.core.boundaries import BoundaryType
-from entroppy.resolution.platform_conflicts.formatting import (
-    FormattingContext,
-    _format_correction_worker,
-    init_formatting_worker,
-)
 
-if TYPE_CHECKING:
-    pass
 
-
-def format_corrections_parallel(
+def format_corrections(
     all_corrections: list[tuple[str, str, BoundaryType]],
-    is_qmk: bool,
-    jobs: int,
     verbose: bool,
     pass_name: str,
-    format_typo_fn: Callable[[str, BoundaryType], str],
+    format_typo_fn: Callable[[str, BoundaryType], str] | None,
 ) -> tuple[
     dict[str, list[tuple[tuple[str, str, BoundaryType], str, BoundaryType]]],
     dict[tuple[str, str, BoundaryType], str],
 ]:
-    """Format corrections in parallel and build lookup structures.
+    """Format corrections and build lookup structures.
+
+    Formatting runs in-process: each typo takes well under a microsecond to format,
+    so shipping corrections to worker processes costs more than the work itself.
 
     Args:
         all_corrections: List of all corrections to format
-        is_qmk: Whether platform is QMK
-        jobs: Number of parallel jobs
         verbose: Whether to show progress
         pass_name: Name of the pass
-        format_typo_fn: Function to format typo for platform
+        format_typo_fn: Function to format typo for platform, or None when the platform
+            uses typos unchanged
 
     Returns:
         Tuple of:
@@ -44,59 +35,25 @@ def format_corrections_parallel(
           list of (correction, typo, boundary)
         - correction_to_formatted: Dict mapping correction -> formatted_typo
     """
-    use_parallel = jobs > 1 and len(all_corrections) >= 100
-
-    if use_parallel:
-        # pylint: disable=duplicate-code
-        # Acceptable pattern: Parallel processing setup using Pool with initializer pattern.
-        # This pattern is shared with formatting.py because both need to set up
-        # parallel formatting workers in the same way. The Pool initialization pattern
-        # is standard and should not be refactored.
-        formatting_context = FormattingContext(is_qmk=is_qmk)
-
-        with Pool(
-            processes=jobs,
-            initializer=init_formatting_worker,
-            initargs=(formatting_context,),
-        ) as pool:
-            if verbose:
-                results_iter = pool.imap(_format_correction_worker, all_corrections)
-                results: Any = tqdm(
-                    results_iter,
-                    desc=f"    {pass_name}",
-                    total=len(all_corrections),
-                    unit="correction",
-                    leave=False,
-                )
-            else:
-                results = pool.imap(_format_correction_worker, all_corrections)
-            formatted_results = list(results)
+    if verbose:
+        corrections_iter: Any = tqdm(
+            all_corrections,
+            desc=f"    {pass_name}",
+            unit="correction",
+            leave=False,
+        )
     else:
-        if verbose:
-            corrections_iter: Any = tqdm(
-                all_corrections,
-                desc=f"    {pass_name}",
-                unit="correction",
-                leave=False,
-            )
-        else:
-            corrections_iter = all_corrections
-
-        formatted_results = [(c, format_typo_fn(c[0], c[2])) for c in corrections_iter]
+        corrections_iter = all_corrections
 
     # Build lookup structures
-    # pylint: disable=duplicate-code
-    # Acceptable pattern: Building lookup structures from formatted results is a common
-    # pattern shared with formatting.py. Both need to build the same lookup structures
-    # (formatted_to_corrections and correction_to_formatted) in the same way.
-    # This is expected when both places need to process formatted corrections identically.
     formatted_to_corrections: dict[
         str, list[tuple[tuple[str, str, BoundaryType], str, BoundaryType]]
     ] = defaultdict(list)
     correction_to_formatted: dict[tuple[str, str, BoundaryType], str] = {}
 
-    for correction, formatted_typo in formatted_results:
+    for correction in corrections_iter:
         typo, _word, boundary = correction
+        formatted_typo = typo if format_typo_fn is None else format_typo_fn(typo, boundary)
         formatted_to_corrections[formatted_typo].append((correction, typo, boundary))
         correction_to_formatted[correction] = formatted_typo
 
@@ -22,22 +22,19 @@ from entroppy.platforms.qmk.formatting import format_boundary_markers
 from entroppy.resolution.platform_conflicts.conflict_processing import (
     process_conflict_combinations,
 )
-from entroppy.resolution.platform_conflicts.detection import is_substring
-from entroppy.resolution.platform_conflicts.formatting_helpers import (
-    format_corrections_parallel,
-)
+from entroppy.resolution.platform_conflicts.formatting_helpers import format_corrections
 from entroppy.resolution.platform_conflicts.logging import log_platform_substring_conflict
-from entroppy.resolution.platform_conflicts.suffix_array_helpers import (
-    build_suffix_array,
-    find_substring_matches,
-)
+from entroppy.resolution.platform_conflicts.suffix_array_helpers import build_suffix_array
 from entroppy.resolution.solver import Pass
 from entroppy.resolution.state import RejectionReason
-from entroppy.utils.suffix_array import SubstringIndex
 
 if TYPE_CHECKING:
+    from entroppy.resolution.solver import PassContext
     from entroppy.resolution.state import DictionaryState
 
+# Typos checked between progress bar updates
+_PROGRESS_UPDATE_INTERVAL = 1024
+
 
 class PlatformSubstringConflictPass(Pass):
     """Detects and removes cross-boundary substring conflicts.
@@ -62,6 +59,19 @@ class PlatformSubstringConflictPass(Pass):
     - Removes duplicates preferring less restrictive boundaries
     """
 
+    def __init__(self, context: "PassContext") -> None:
+        """Initialize the pass with context and formatted typo cache.
+
+        Args:
+            context: Shared context with resources
+        """
+        super().__init__(context)
+        # Whether the platform formats boundaries into the typo, set in run
+        self._is_qmk = False
+        # Cache for formatted typos, reused across solver iterations
+        # Key: (typo, boundary) - Value: formatted typo
+        self._format_cache: dict[tuple[str, BoundaryType], str] = {}
+
     @property
     def name(self) -> str:
         """Return the name of this pass."""
@@ -77,6 +87,8 @@ class PlatformSubstringConflictPass(Pass):
             # No platform specified, skip
             return
 
+        self._is_qmk = self.context.platform.__class__.__name__ == "QMKBackend"
+
         # Get platform constraints
         constraints = self.context.platform.get_constraints()
         match_direction = constraints.match_direction
@@ -87,8 +99,8 @@ class PlatformSubstringConflictPass(Pass):
         if not all_corrections:
             return
 
-        # Phase 1: Format corrections (with parallelization)
-        formatted_to_corrections, correction_to_formatted = self._format_corrections_parallel(
+        # Phase 1: Format corrections
+        formatted_to_corrections, correction_to_formatted = self._format_corrections(
             all_corrections
         )
 
@@ -102,13 +114,13 @@ class PlatformSubstringConflictPass(Pass):
             state, corrections_to_remove, conflict_pairs, correction_to_formatted
         )
 
-    def _format_corrections_parallel(
+    def _format_corrections(
         self, all_corrections: list[tuple[str, str, BoundaryType]]
     ) -> tuple[
         dict[str, list[tuple[tuple[str, str, BoundaryType], str, BoundaryType]]],
         dict[tuple[str, str, BoundaryType], str],
     ]:
-        """Format corrections in parallel and build lookup structures.
+        """Format corrections and build lookup structures.
 
         Args:
             all_corrections: List of all corrections to format
@@ -119,92 +131,67 @@ class PlatformSubstringConflictPass(Pass):
               list of (correction, typo, boundary)
             - correction_to_formatted: Dict mapping correction -> formatted_typo
         """
-        is_qmk = self.context.platform.__class__.__name__ == "QMKBackend"
-        return format_corrections_parallel(
+        return format_corrections(
             all_corrections,
-            is_qmk,
-            self.context.jobs,
             self.context.verbose,
             self.name,
-            self._format_typo_for_platform,
+            # Only QMK formats boundaries into the typo; skip the call per typo elsewhere
+            self._format_typo_for_platform if self._is_qmk else None,
         )
 
     def _process_typo_conflicts(
         self,
-        i: int,
         formatted_typo: str,
         corrections_for_typo: list[tuple[tuple[str, str, BoundaryType], str, BoundaryType]],
+        matched_typo_indices: list[int],
         formatted_typos: list[str],
         formatted_to_corrections: dict[
             str, list[tuple[tuple[str, str, BoundaryType], str, BoundaryType]]
         ],
         match_direction: MatchDirection,
-        processed_pairs: set[frozenset[tuple[str, str, BoundaryType]]],
         corrections_to_remove_set: set[tuple[str, str, BoundaryType]],
         all_corrections_to_remove: list[tuple[tuple[str, str, BoundaryType], str]],
-        all_conflict_pairs: dict[tuple[str, str, BoundaryType], tuple[str, str, BoundaryType]],
-        sa: SubstringIndex,
+        all_conflict_pairs: (
+            dict[tuple[str, str, BoundaryType], tuple[str, str, BoundaryType]] | None
+        ),
         state: "DictionaryState",
     ) -> None:
         """Process conflicts for a single formatted typo.
 
         Args:
-            i: Index of current typo
             formatted_typo: Current formatted typo
             corrections_for_typo: Corrections for current typo
+            matched_typo_indices: Indices of the longer typos containing this typo
             formatted_typos: List of all formatted typos
             formatted_to_corrections: Dict mapping typo to corrections
             match_direction: Platform match direction
-            processed_pairs: Set of processed pairs
             corrections_to_remove_set: Set of corrections to remove
             all_corrections_to_remove: List to append removals
-            all_conflict_pairs: Dict to update with conflict pairs
-            sa: Suffix array
+            all_conflict_pairs: Dict to update with conflict pairs, or None when not debugging
             state: Dictionary state
         """
-        # Find which typos contain this as a substring using suffix array
-        matched_typo_indices = find_substring_matches(sa, formatted_typo)
-
-        # Check each match for conflicts
+        # Check each match for conflicts, matches are always the longer typo
         for match_idx in matched_typo_indices:
-            if match_idx == i:
-                continue  # Skip self
-
             matched_typo = formatted_typos[match_idx]
-            matched_corrections = formatted_to_corrections[matched_typo]
-
-            # Determine which is shorter/longer for conflict resolution
-            if len(formatted_typo) < len(matched_typo):
-                shorter_typo = formatted_typo
-                longer_typo = matched_typo
-                shorter_corrections = corrections_for_typo
-                longer_corrections = matched_corrections
-            elif len(formatted_typo) > len(matched_typo):
-                shorter_typo = matched_typo
-                longer_typo = formatted_typo
-                shorter_corrections = matched_corrections
-                longer_corrections = corrections_for_typo
-            else:
-                # Same length - check if they're actually substrings
-                if formatted_typo != matched_typo:
-                    # Different strings of same length can't be substrings
-                    continue
-                # Same string - skip (duplicate)
-                continue
+            shorter_typo = formatted_typo
+            longer_typo = matched_typo
+            shorter_corrections = corrections_for_typo
+            longer_corrections = formatted_to_corrections[matched_typo]
 
-            # Suffix array already found this as a substring match
+            # Suffix array already found this as a strictly longer substring match
             # Quick CPU verification to ensure it's actually a substring (handles edge cases)
-            if not is_substring(shorter_typo, longer_typo):
+            if not shorter_typo or shorter_typo not in longer_typo:
                 continue
 
-            # Process all combinations of corrections
+            # Process all combinations of corrections. Each (shorter, longer) typo pair
+            # is visited once, so no correction pair repeats and dedup can be skipped
             process_conflict_combinations(
                 shorter_typo,
                 longer_typo,
                 shorter_corrections,
                 longer_corrections,
                 match_direction,
-                processed_pairs,
+                None,
                 corrections_to_remove_set,
                 all_corrections_to_remove,
                 all_conflict_pairs,
@@ -223,7 +210,7 @@ class PlatformSubstringConflictPass(Pass):
         state: "DictionaryState",
     ) -> tuple[
         list[tuple[tuple[str, str, BoundaryType], str]],
-        dict[tuple[str, str, BoundaryType], tuple[str, str, BoundaryType]],
+        dict[tuple[str, str, BoundaryType], tuple[str, str, BoundaryType]] | None,
     ]:
         """Detect conflicts using suffix array helpers.
 
@@ -232,7 +219,7 @@ class PlatformSubstringConflictPass(Pass):
         This uses:
         - Suffix array to enable O(log N + M) substring queries instead of O(N²)
         - Build suffix array once from all formatted typos
-        - Query for each typo to find all substring matches efficiently
+        - Query all typos in one call to find the longer typos containing each
 
         Args:
             formatted_to_corrections: Dict mapping formatted_typo ->
@@ -243,11 +230,14 @@ class PlatformSubstringConflictPass(Pass):
         Returns:
             Tuple of:
             - corrections_to_remove: List of (correction, reason) tuples
-            - conflict_pairs: Dict mapping removed_correction -> conflicting_correction
+            - conflict_pairs: Dict mapping removed_correction -> conflicting_correction,
+              or None unless debug words or debug typos are set
         """
         all_corrections_to_remove: list[tuple[tuple[str, str, BoundaryType], str]] = []
-        all_conflict_pairs: dict[tuple[str, str, BoundaryType], tuple[str, str, BoundaryType]] = {}
-        processed_pairs: set[frozenset[tuple[str, str, BoundaryType]]] = set()
+        # Conflict pairs are only read for debug logging, so skip recording them otherwise
+        all_conflict_pairs: (
+            dict[tuple[str, str, BoundaryType], tuple[str, str, BoundaryType]] | None
+        ) = {} if state.debug_words or state.debug_typo_matcher else None
 
         # Track corrections already marked for removal (early termination optimization)
         corrections_to_remove_set: set[tuple[str, str, BoundaryType]] = set()
@@ -271,30 +261,39 @@ class PlatformSubstringConflictPass(Pass):
         else:
             progress_bar = None
 
-        # Process each formatted typo
-        for i, formatted_typo in enumerate(formatted_typos):
+        # One call into the extension finds the longer typos containing every typo
+        longer_matches = sa.find_longer_containing()
+
+        # Process each formatted typo, updating the progress bar in batches
+        pending = 0
+        for formatted_typo, matched_typo_indices in zip(formatted_typos, longer_matches):
             if progress_bar is not None:
-                progress_bar.update(1)
+                pending += 1
+                if pending >= _PROGRESS_UPDATE_INTERVAL:
+                    progress_bar.update(pending)
+                    pending = 0
+
+            if not matched_typo_indices:
+                continue
 
             corrections_for_typo = formatted_to_corrections[formatted_typo]
 
             # Process conflicts for this typo
             self._process_typo_conflicts(
-                i,
                 formatted_typo,
                 corrections_for_typo,
+                matched_typo_indices,
                 formatted_typos,
                 formatted_to_corrections,
                 match_direction,
-                processed_pairs,
                 corrections_to_remove_set,
                 all_corrections_to_remove,
                 all_conflict_pairs,
-                sa,
                 state,
             )
 
         if progress_bar is not None:
+            progress_bar.update(pending)
             progress_bar.close()
 
         return all_corrections_to_remove, all_conflict_pairs
@@ -304,7 +303,7 @@ class PlatformSubstringConflictPass(Pass):
         state: "DictionaryState",
         correction: tuple[str, str, BoundaryType],
         reason: str,
-        conflict_pairs: dict[tuple[str, str, BoundaryType], tuple[str, str, BoundaryType]],
+        conflict_pairs: dict[tuple[str, str, BoundaryType], tuple[str, str, BoundaryType]] | None,
         correction_to_formatted: dict[tuple[str, str, BoundaryType], str],
     ) -> None:
         """Remove a single conflicting correction and perform debug logging.
@@ -313,27 +312,23 @@ class PlatformSubstringConflictPass(Pass):
             state: The dictionary state to modify
             correction: The correction to remove
             reason: Reason for removal
-            conflict_pairs: Dict mapping removed_correction -> conflicting_correction
+            conflict_pairs: Dict mapping removed_correction -> conflicting_correction,
+                or None when not debugging
             correction_to_formatted: Dict mapping correction -> formatted_typo
         """
         typo, word, boundary = correction
 
-        # Get conflicting correction and formatted strings
-        conflicting_correction = conflict_pairs.get(correction)
-        formatted_removed = correction_to_formatted.get(correction, "")
-        formatted_conflicting = (
-            correction_to_formatted.get(conflicting_correction, "")
-            if conflicting_correction
-            else ""
+        # Debug logging. The conflicting correction was recorded during detection,
+        # so both lookups are O(1); pairs are only recorded when something is debugged
+        conflicting_correction = (
+            conflict_pairs.get(correction) if conflict_pairs is not None else None
         )
-
-        # Debug logging
         if conflicting_correction:
             log_platform_substring_conflict(
                 correction,
                 conflicting_correction,
-                formatted_removed,
-                formatted_conflicting,
+                correction_to_formatted.get(correction, ""),
+                correction_to_formatted.get(conflicting_correction, ""),
                 reason,
                 state.debug_words,
                 state.debug_typo_matcher,
@@ -367,7 +362,7 @@ class PlatformSubstringConflictPass(Pass):
         self,
         state: "DictionaryState",
         corrections_to_remove: list[tuple[tuple[str, str, BoundaryType], str]],
-        conflict_pairs: dict[tuple[str, str, BoundaryType], tuple[str, str, BoundaryType]],
+        conflict_pairs: dict[tuple[str, str, BoundaryType], tuple[str, str, BoundaryType]] | None,
         correction_to_formatted: dict[tuple[str, str, BoundaryType], str],
     ) -> None:
         """Remove conflicting corrections and perform debug logging.
@@ -375,20 +370,17 @@ class PlatformSubstringConflictPass(Pass):
         Args:
             state: The dictionary state to modify
             corrections_to_remove: List of (correction, reason) tuples
-            conflict_pairs: Dict mapping removed_correction -> conflicting_correction
+            conflict_pairs: Dict mapping removed_correction -> conflicting_correction,
+                or None when not debugging
             correction_to_formatted: Dict mapping correction -> formatted_typo
         """
-        # Deduplicate corrections to remove
-        seen = set()
+        # Detection records each correction at most once, so no deduplication is needed
         for correction, reason in corrections_to_remove:
-            if correction in seen:
-                continue
-            seen.add(correction)
             self._remove_single_conflict(
                 state, correction, reason, conflict_pairs, correction_to_formatted
             )
 
-    def _format_typo_for_platform(self, typo: str, boundary) -> str:
+    def _format_typo_for_platform(self, typo: str, boundary: BoundaryType) -> str:
         """Format typo with platform-specific boundary markers.
 
         For QMK, boundaries are part of the formatted string (colon notation).
@@ -402,12 +394,16 @@ class PlatformSubstringConflictPass(Pass):
         Returns:
             Formatted typo string with boundary markers (for QMK) or core typo (for others)
         """
-        # For QMK, use colon notation (boundaries are part of the string)
-        if self.context.platform.__class__.__name__ == "QMKBackend":
-            return format_boundary_markers(typo, boundary)
-
         # For Espanso and other platforms, boundaries are handled separately
         # in output format, so we just use the core typo for substring checking
         # The same core typo with different boundaries are different matches
         # but we still check if core typos are substrings of each other
-        return typo
+        if not self._is_qmk:
+            return typo
+
+        # For QMK, use colon notation (boundaries are part of the string)
+        key = (typo, boundary)
+        formatted = self._format_cache.get(key)
+        if formatted is None:
+            formatted = self._format_cache[key] = format_boundary_markers(typo, boundary)
+        return formatted
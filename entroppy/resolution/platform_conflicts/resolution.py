@@ -28,6 +28,12 @@ BOUNDARY_PRIORITY = {
     BoundaryType.BOTH: 2,  # Most restrictive (matches standalone words only)
 }
 
+# Same priorities keyed by the enum's string value. Enum.__hash__ is implemented in
+# Python, while str caches its hash, so the comparators below look up _value_ here.
+_BOUNDARY_PRIORITY_BY_VALUE = {
+    boundary.value: priority for boundary, priority in BOUNDARY_PRIORITY.items()
+}
+
 
 def _identify_less_restrictive_boundary(
     shorter_typo: str,
@@ -38,8 +44,10 @@ def _identify_less_restrictive_boundary(
     longer_boundary: BoundaryType,
 ) -> tuple[str, str, BoundaryType, BoundaryType] | None:
     """Identify which boundary is less restrictive, returning None if same priority."""
-    shorter_priority = BOUNDARY_PRIORITY.get(shorter_boundary, 0)
-    longer_priority = BOUNDARY_PRIORITY.get(longer_boundary, 0)
+    # pylint: disable-next=protected-access
+    shorter_priority = _BOUNDARY_PRIORITY_BY_VALUE[shorter_boundary._value_]
+    # pylint: disable-next=protected-access
+    longer_priority = _BOUNDARY_PRIORITY_BY_VALUE[longer_boundary._value_]
 
     if shorter_priority < longer_priority:
         return shorter_typo, shorter_word, shorter_boundary, longer_boundary
@@ -82,9 +90,8 @@ def _check_and_prefer_less_restrictive(
     )
 
     # Log false trigger check if debugging
-    if debug_words is not None or debug_typo_matcher is not None:
-        reason_value = details.get("reason") if details else None
-        reason_str = reason_value if isinstance(reason_value, str) else None
+    if debug_words or debug_typo_matcher:
+        reason_str = details.reason
         log_false_trigger_check(
             less_restrictive_typo,
             less_restrictive_word,
@@ -163,7 +170,7 @@ def should_remove_shorter(
     ) = result
 
     # Log boundary comparison if debugging
-    if debug_words is not None or debug_typo_matcher is not None:
+    if debug_words or debug_typo_matcher:
         # Determine more restrictive typo for logging
         more_restrictive_typo = (
             longer_typo if less_restrictive_boundary == shorter_boundary else shorter_typo
@@ -226,8 +233,10 @@ def _determine_less_restrictive_boundary(
     Returns:
         Tuple of (less_restrictive_typo, less_restrictive_boundary)
     """
-    shorter_priority = BOUNDARY_PRIORITY.get(boundary1, 0)
-    longer_priority = BOUNDARY_PRIORITY.get(boundary2, 0)
+    # pylint: disable-next=protected-access
+    shorter_priority = _BOUNDARY_PRIORITY_BY_VALUE[boundary1._value_]
+    # pylint: disable-next=protected-access
+    longer_priority = _BOUNDARY_PRIORITY_BY_VALUE[boundary2._value_]
     if shorter_priority < longer_priority:
         return typo1, boundary1
     if longer_priority < shorter_priority:
@@ -271,78 +280,92 @@ def _check_false_triggers_for_conflict(
         source_index,
         target_word=word1 if less_restrictive_typo == typo1 else word2,
     )
-    reason_value = details.get("reason") if details else None
-    false_trigger_reason = reason_value if isinstance(reason_value, str) else None
+    false_trigger_reason = details.reason
     return would_cause, false_trigger_reason
 
 
-def _log_conflict_resolution(
-    typo1: str,
-    word1: str,
+def _log_conflict_decision(
+    correction1: tuple[str, str, BoundaryType],
+    correction2: tuple[str, str, BoundaryType],
     boundary1: BoundaryType,
-    typo2: str,
-    word2: str,
     boundary2: BoundaryType,
-    less_restrictive_typo: str,
-    less_restrictive_boundary: BoundaryType,
-    checked_false_triggers: bool,
-    would_cause_false_triggers: bool | None,
-    false_trigger_reason: str | None,
+    match_direction: MatchDirection,
+    validation_index: BoundaryIndex | None,
+    source_index: BoundaryIndex | None,
     debug_words: set[str],
     debug_typo_matcher: "DebugTypoMatcher | None",
     remove_first: bool,
 ) -> None:
-    """Log conflict resolution decision.
+    """Log how a conflict pair was resolved, with its less restrictive boundary.
+
+    The less restrictive boundary and its false trigger check are only logged,
+    should_remove_shorter already made the decision, so this runs only when debugging.
 
     Args:
-        typo1: First typo
-        word1: First word
-        boundary1: First boundary
-        typo2: Second typo
-        word2: Second word
-        boundary2: Second boundary
-        less_restrictive_typo: Less restrictive typo
-        less_restrictive_boundary: Less restrictive boundary
-        checked_false_triggers: Whether false triggers were checked
-        would_cause_false_triggers: Whether false triggers would occur
-        false_trigger_reason: Reason for false triggers
+        correction1: First correction (from shorter formatted typo)
+        correction2: Second correction (from longer formatted typo)
+        boundary1: Boundary type for correction1
+        boundary2: Boundary type for correction2
+        match_direction: Platform match direction
+        validation_index: Optional boundary index for validation set
+        source_index: Optional boundary index for source words
         debug_words: Set of words to debug
         debug_typo_matcher: Matcher for debug typos
-        remove_first: Whether removing first correction
+        remove_first: Whether correction1 is the one being removed
     """
-    if debug_words or debug_typo_matcher:
-        if remove_first:
-            log_resolution_decision(
-                typo1,
-                word1,
-                boundary1,
-                typo2,
-                word2,
-                boundary2,
-                less_restrictive_typo,
-                less_restrictive_boundary,
-                checked_false_triggers,
-                would_cause_false_triggers,
-                false_trigger_reason,
-                debug_words,
-                debug_typo_matcher,
-            )
-        else:
-            log_resolution_decision(
-                typo2,
-                word2,
-                boundary2,
-                typo1,
-                word1,
-                boundary1,
-                less_restrictive_typo,
-                less_restrictive_boundary,
-                checked_false_triggers,
-                would_cause_false_triggers,
-                false_trigger_reason,
-                debug_words,
-                debug_typo_matcher,
-            )
+    typo1, word1, _ = correction1
+    typo2, word2, _ = correction2
+    less_restrictive_typo, less_restrictive_boundary = _determine_less_restrictive_boundary(
+        boundary1, boundary2, typo1, typo2, match_direction
+    )
+    would_cause_false_triggers, false_trigger_reason = _check_false_triggers_for_conflict(
+        less_restrictive_typo,
+        less_restrictive_boundary,
+        word1,
+        word2,
+        typo1,
+        validation_index,
+        source_index,
+    )
+
+    removed, kept = (typo1, word1, boundary1), (typo2, word2, boundary2)
+    if not remove_first:
+        removed, kept = kept, removed
+    log_resolution_decision(
+        *removed,
+        *kept,
+        less_restrictive_typo,
+        less_restrictive_boundary,
+        validation_index is not None and source_index is not None,
+        would_cause_false_triggers,
+        false_trigger_reason,
+        debug_words,
+        debug_typo_matcher,
+    )
+
+
+def _already_processed(
+    pair_id: tuple[tuple[str, str, BoundaryType], tuple[str, str, BoundaryType]],
+    processed_pairs: (
+        set[tuple[tuple[str, str, BoundaryType], tuple[str, str, BoundaryType]]] | None
+    ),
+) -> bool:
+    """Check whether a conflict pair was already processed, recording it if not.
+
+    Args:
+        pair_id: Ordered (shorter correction, longer correction) pair
+        processed_pairs: Set of already processed correction pairs, or None when the
+            caller visits each pair only once
+
+    Returns:
+        True if the pair was seen before, False otherwise
+    """
+    if processed_pairs is None:
+        return False
+    if pair_id in processed_pairs:
+        return True
+    processed_pairs.add(pair_id)
+    return False
 
 
 def process_conflict_pair(
@@ -353,7 +376,9 @@ def process_conflict_pair(
     boundary1: BoundaryType,
     boundary2: BoundaryType,
     match_direction: MatchDirection,
-    processed_pairs: set[frozenset[tuple[str, str, BoundaryType]]],
+    processed_pairs: (
+        set[tuple[tuple[str, str, BoundaryType], tuple[str, str, BoundaryType]]] | None
+    ),
     corrections_to_remove_set: set[tuple[str, str, BoundaryType]],
     validation_index: BoundaryIndex | None = None,
     source_index: BoundaryIndex | None = None,
@@ -373,7 +398,8 @@ def process_conflict_pair(
         boundary1: Boundary type for correction1
         boundary2: Boundary type for correction2
         match_direction: Platform match direction
-        processed_pairs: Set of already processed correction pairs
+        processed_pairs: Set of already processed correction pairs, or None when the
+            caller visits each pair only once
         corrections_to_remove_set: Set of corrections already marked for removal
         validation_index: Optional boundary index for validation set (for false trigger checks)
         source_index: Optional boundary index for source words (for false trigger checks)
@@ -389,34 +415,16 @@ def process_conflict_pair(
     if correction1 in corrections_to_remove_set or correction2 in corrections_to_remove_set:
         return None, None
 
-    # Use frozenset to create unique pair identifier
-    pair_id = frozenset([correction1, correction2])
-    if pair_id in processed_pairs:
+    # correction1 always comes from the shorter formatted typo, so the ordered
+    # tuple already identifies the pair uniquely
+    if _already_processed((correction1, correction2), processed_pairs):
         return None, None
-    processed_pairs.add(pair_id)
 
     # Determine which one to remove based on match direction and false trigger checks
     typo1, word1, _ = correction1
     typo2, word2, _ = correction2
 
-    # Determine which boundary is less restrictive
-    less_restrictive_typo, less_restrictive_boundary = _determine_less_restrictive_boundary(
-        boundary1, boundary2, typo1, typo2, match_direction
-    )
-
-    # Check false triggers to determine decision
-    checked_false_triggers = validation_index is not None and source_index is not None
-    would_cause_false_triggers, false_trigger_reason = _check_false_triggers_for_conflict(
-        less_restrictive_typo,
-        less_restrictive_boundary,
-        word1,
-        word2,
-        typo1,
-        validation_index,
-        source_index,
-    )
-
-    if should_remove_shorter(
+    remove_shorter = should_remove_shorter(
         match_direction,
         typo1,
         typo2,
@@ -428,31 +436,29 @@ def process_conflict_pair(
         source_index,
         debug_words,
         debug_typo_matcher,
-    ):
-        # Remove the shorter formatted one (formatted1)
-        reason = (
-            f"Cross-boundary substring conflict: "
-            f"'{shorter_formatted_typo}' is substring of "
-            f"'{formatted_typo}'"
-        )
+    )
 
-        _log_conflict_resolution(
-            typo1,
-            word1,
+    if debug_words or debug_typo_matcher:
+        _log_conflict_decision(
+            correction1,
+            correction2,
             boundary1,
-            typo2,
-            word2,
             boundary2,
-            less_restrictive_typo,
-            less_restrictive_boundary,
-            checked_false_triggers,
-            would_cause_false_triggers,
-            false_trigger_reason,
+            match_direction,
+            validation_index,
+            source_index,
             debug_words or set(),
             debug_typo_matcher,
-            remove_first=True,
+            remove_first=remove_shorter,
         )
 
+    if remove_shorter:
+        # Remove the shorter formatted one (formatted1)
+        reason = (
+            f"Cross-boundary substring conflict: "
+            f"'{shorter_formatted_typo}' is substring of "
+            f"'{formatted_typo}'"
+        )
         return (correction1, reason), (correction1, correction2)
 
     # Remove the longer formatted one (formatted2)
@@ -461,22 +467,4 @@ def process_conflict_pair(
         f"'{formatted_typo}' contains substring "
         f"'{shorter_formatted_typo}'"
     )
-
-    _log_conflict_resolution(
-        typo2,
-        word2,
-        boundary2,
-        typo1,
-        word1,
-        boundary1,
-        less_restrictive_typo,
-        less_restrictive_boundary,
-        checked_false_triggers,
-        would_cause_false_triggers,
-        false_trigger_reason,
-        debug_words or set(),
-        debug_typo_matcher,
-        remove_first=False,
-    )
-
     return (correction2, reason), (correction2, correction1)
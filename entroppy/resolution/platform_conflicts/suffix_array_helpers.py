@@ -37,23 +37,3 @@ def build_suffix_array(formatted_typos: list[str], verbose: bool, pass_name: str
         build_bar.close()
 
     return sa
-
-
-def find_substring_matches(
-    sa: SubstringIndex,
-    formatted_typo: str,
-) -> set[int]:
-    """Find which typos contain the given typo as a substring using suffix array.
-
-    Uses Rust implementation for ~100x performance improvement.
-
-    Args:
-        sa: SubstringIndex instance (wraps Rust implementation)
-        formatted_typo: The typo to search for
-
-    Returns:
-        Set of indices of typos that contain formatted_typo as substring
-    """
-    # Use Rust implementation - O(log N + M) query, no linear scan
-    matched_indices = sa.find_substring_conflicts(formatted_typo)
-    return set(matched_indices)
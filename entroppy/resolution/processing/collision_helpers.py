@@ -13,7 +13,7 @@ if TYPE_CHECKING:
 def _resolve_collision_by_frequency(
     words_in_group: list[str],
     freq_ratio: float,
-) -> tuple[str | None, float]:
+) -> tuple[str | None, float, list[tuple[str, float]]]:
     """Resolve collision by frequency analysis.
 
     Args:
@@ -21,23 +21,33 @@ def _resolve_collision_by_frequency(
         freq_ratio: Minimum frequency ratio for resolution
 
     Returns:
-        Tuple of (selected_word, ratio). selected_word is None if ambiguous.
+        Tuple of (selected_word, ratio, word_freqs). selected_word is None if ambiguous.
+        word_freqs holds (word, frequency) in input order so callers can log it without
+        looking the frequencies up again.
     """
     word_freqs = [(w, cached_word_frequency(w, "en")) for w in words_in_group]
-    word_freqs.sort(key=lambda x: x[1], reverse=True)
 
+    # Only the two highest frequencies matter, so one pass replaces a full sort.
+    # Ties keep the earlier word first, the same as a stable descending sort.
     most_common = word_freqs[0]
-    second_most = word_freqs[1] if len(word_freqs) > 1 else (None, 0)
+    second_most: tuple[str | None, float] = (None, 0)
+    for word_freq in word_freqs[1:]:
+        if word_freq[1] > most_common[1]:
+            second_most = most_common
+            most_common = word_freq
+        elif second_most[0] is None or word_freq[1] > second_most[1]:
+            second_most = word_freq
     ratio = most_common[1] / second_most[1] if second_most[1] > 0 else float("inf")
 
     if ratio > freq_ratio:
-        return most_common[0], ratio
-    return None, ratio
+        return most_common[0], ratio, word_freqs
+    return None, ratio, word_freqs
 
 
 def _log_collision_debug(
     typo: str,
     words_in_group: list[str],
+    word_freqs: list[tuple[str, float]],
     boundary: BoundaryType,
     ratio: float,
     freq_ratio: float,
@@ -49,13 +59,13 @@ def _log_collision_debug(
     Args:
         typo: The typo string
         words_in_group: List of words in collision
+        word_freqs: (word, frequency) for each word, from _resolve_collision_by_frequency
         boundary: The boundary type
         ratio: Frequency ratio
         freq_ratio: Minimum frequency ratio threshold
         is_resolved: Whether collision was resolved
         debug_typo_matcher: Matcher for debug typos
     """
-    word_freqs = [(w, cached_word_frequency(w, "en")) for w in words_in_group]
     words_with_freqs = ", ".join([f"{w} (freq: {f:.2e})" for w, f in word_freqs])
     matched_patterns = (
         debug_typo_matcher.get_matching_patterns(typo, boundary) if debug_typo_matcher else None
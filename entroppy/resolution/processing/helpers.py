@@ -6,14 +6,15 @@ from typing import TYPE_CHECKING
 from entroppy.core import BoundaryType, Correction
 from entroppy.core.boundaries import BoundaryIndex
 from entroppy.matching import ExclusionMatcher
-from entroppy.resolution.boundaries.selection import choose_boundary_for_typo
+from entroppy.resolution.boundaries.selection import choose_boundaries_for_typos
 from entroppy.resolution.boundaries.utils import (
     _should_skip_short_typo,
     apply_user_word_boundary_override,
 )
 from entroppy.resolution.exclusion import handle_exclusion
 from entroppy.resolution.false_trigger_check import _check_false_trigger_with_details
-from entroppy.utils.debug import is_debug_correction, log_if_debug_correction
+from entroppy.utils.debug import is_debug_correction, is_debug_typo, log_if_debug_correction
+from entroppy.utils.logging import is_debug_enabled
 
 from .collision_helpers import (
     _log_collision_debug,
@@ -39,7 +40,7 @@ def _prepare_boundary_and_collect_details(
     """Prepare boundary (apply overrides) and collect details, check if should skip.
 
     This helper function centralizes the common pattern of:
-    1. Collecting boundary details (if not in debug mode)
+    1. Collecting boundary details (only for debug typos)
     2. Applying user word boundary override
     3. Checking if typo should be skipped due to length
 
@@ -61,10 +62,15 @@ def _prepare_boundary_and_collect_details(
         boundary_details is dict with boundary selection info for later logging, or None.
         should_skip is True if typo should be skipped due to length.
     """
-    # Collect boundary details for later logging
-    # (only if debug_typo_matcher is None, i.e., in worker)
+    # Collect boundary details for later logging. Only typos that
+    # log_boundary_selection_details will log need them, and only when DEBUG
+    # messages are emitted at all
     boundary_details = None
-    if not debug_typo_matcher:
+    if (
+        debug_typo_matcher
+        and is_debug_typo(typo, boundary, debug_typo_matcher)
+        and is_debug_enabled()
+    ):
         boundary_details = _collect_boundary_details(
             typo,
             word,
@@ -119,7 +125,7 @@ def _collect_boundary_details(
     return {
         "typo": typo,
         "word": word,
-        "boundary": boundary.value,
+        "boundary": boundary,
         "details": details,
     }
 
@@ -145,22 +151,17 @@ def _group_words_by_boundary(
     Returns:
         Dictionary mapping boundary type to list of words with that boundary
     """
-    word_boundary_map = {}
-    for word in unique_words:
-        # pylint: disable=duplicate-code
-        # Acceptable pattern: This is a function call to choose_boundary_for_typo
-        # with standard parameters. The similar code in correction_processor.py calls
-        # the same function with the same parameters. This is expected when both places
-        # need to determine boundaries for words.
-        boundary = choose_boundary_for_typo(
-            typo,
-            validation_index,
-            source_index,
-            debug_words=debug_words,
-            debug_typo_matcher=debug_typo_matcher,
-            word=word,  # CRITICAL: Pass target word!
-        )
-        word_boundary_map[word] = boundary
+    # CRITICAL: Pass target words!
+    target_words: list[str | None] = list(unique_words)
+    boundaries = choose_boundaries_for_typos(
+        [typo] * len(unique_words),
+        target_words,
+        validation_index,
+        source_index,
+        debug_words=debug_words,
+        debug_typo_matcher=debug_typo_matcher,
+    )
+    word_boundary_map = dict(zip(unique_words, boundaries))
 
     by_boundary = defaultdict(list)
     for word, boundary in word_boundary_map.items():
@@ -289,12 +290,13 @@ def _process_collision_boundary_group(
         boundary_details is dict with boundary selection info for later logging, or None.
     """
     # Resolve collision by frequency
-    selected_word, ratio = _resolve_collision_by_frequency(words_in_group, freq_ratio)
+    selected_word, ratio, word_freqs = _resolve_collision_by_frequency(words_in_group, freq_ratio)
 
     if is_debug_collision:
         _log_collision_debug(
             typo,
             words_in_group,
+            word_freqs,
             boundary,
             ratio,
             freq_ratio,
@@ -351,7 +353,14 @@ def _process_collision_boundary_group(
     )
     if is_debug:
         _log_collision_debug(
-            typo, words_in_group, boundary, ratio, freq_ratio, False, debug_typo_matcher
+            typo,
+            words_in_group,
+            word_freqs,
+            boundary,
+            ratio,
+            freq_ratio,
+            False,
+            debug_typo_matcher,
         )
     return None, None, (typo, words_in_group, ratio, boundary), None
 
@@ -75,9 +75,6 @@ class DictionaryState:
         # Track pattern replacements for reporting
         self.pattern_replacements: dict[Correction, list[Correction]] = {}
 
-        # Cache for formatted correction strings (typo with boundary markers)
-        self._formatted_cache: dict[Correction, str] = {}
-
         # Optimization caches for CandidateSelection pass
         self.caching = StateCaching()
 
@@ -455,14 +452,6 @@ class DictionaryState:
         """
         return get_debug_summary(self.debug_trace)
 
-    def get_formatted_cache(self) -> dict[Correction, str]:
-        """Get the formatted cache for corrections.
-
-        Returns:
-            Dictionary mapping corrections to their formatted typo strings
-        """
-        return self._formatted_cache
-
     def _is_debug_target(self, typo: str, word: str, boundary: BoundaryType) -> bool:
         """Check if a correction should be tracked for debugging.
 
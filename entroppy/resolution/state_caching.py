@@ -4,7 +4,10 @@ from typing import TYPE_CHECKING
 
 from entroppy.core import BoundaryType
 from entroppy.core.boundaries import determine_boundaries
-from entroppy.resolution.false_trigger_check import _check_false_trigger_with_details
+from entroppy.resolution.false_trigger_check import (
+    FalseTriggerDetails,
+    _check_false_trigger_with_details,
+)
 
 if TYPE_CHECKING:
     from entroppy.core.boundaries.types import BoundaryIndex
@@ -19,9 +22,10 @@ class StateCaching:
         self._boundary_cache: dict[str, BoundaryType] = {}
         # Pattern coverage cache: typo -> bool (invalidated when patterns added/removed)
         self._pattern_coverage_cache: dict[str, bool] = {}
-        # False trigger cache: (typo, boundary) -> (bool, dict) (cleared at start of each iteration)
+        # False trigger cache: (typo, boundary) -> (bool, details)
+        # (cleared at start of each iteration)
         self._false_trigger_cache: dict[
-            tuple[str, BoundaryType], tuple[bool, dict[str, bool | str | None]]
+            tuple[str, BoundaryType], tuple[bool, FalseTriggerDetails]
         ] = {}
         # Batch false trigger results: typo -> dict of batch check results
         # (cleared at start of each iteration)
@@ -59,7 +63,7 @@ class StateCaching:
         validation_index: "BoundaryIndex",
         source_index: "BoundaryIndex",
         target_word: str | None = None,
-    ) -> tuple[bool, dict[str, bool | str | None]]:
+    ) -> tuple[bool, FalseTriggerDetails]:
         """Get false trigger check result, using cache if available.
 
         Args:
@@ -70,7 +74,7 @@ class StateCaching:
             target_word: Optional target word to check against
 
         Returns:
-            Tuple of (would_cause_false_trigger, details_dict)
+            Tuple of (would_cause_false_trigger, details)
         """
         cache_key = (typo, boundary)
         if cache_key in self._false_trigger_cache:
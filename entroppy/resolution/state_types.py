@@ -9,7 +9,8 @@ from entroppy.core.boundaries import BoundaryType
 from entroppy.resolution.history import RejectionReason
 
 
-@dataclass
+# Created for every rejection, so slots avoid a per-instance __dict__
+@dataclass(slots=True)
 class GraveyardEntry:
     """A rejected correction with context."""
 
@@ -21,7 +22,7 @@ class GraveyardEntry:
     iteration: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class DebugTraceEntry:
     """A log entry for debug tracing."""
 
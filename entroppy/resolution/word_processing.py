@@ -183,7 +183,8 @@ def process_word(
         # For now, check with NONE boundary as a placeholder
         typo_debug_check = is_debug_typo(typo, BoundaryType.NONE, debug_typo_matcher)
 
-        log_typo_generated(debug_messages, word, typo, debug_words)
+        if is_debug:
+            log_typo_generated(debug_messages, word, typo, debug_words)
 
         # Check if typo should be filtered
         should_filter, filter_reason = _should_filter_typo(
@@ -196,18 +197,20 @@ def process_word(
         )
 
         if should_filter:
-            word_msg = f"Typo '{typo}' filtered - {filter_reason}"
-            typo_msg = f"Filtered - {filter_reason}"
-            add_debug_message(
-                debug_messages,
-                is_debug,
-                typo_debug_check,
-                word,
-                typo,
-                word_msg,
-                typo_msg,
-                debug_typo_matcher,
-            )
+            # Only build the messages when they will be recorded
+            if is_debug or typo_debug_check:
+                word_msg = f"Typo '{typo}' filtered - {filter_reason}"
+                typo_msg = f"Filtered - {filter_reason}"
+                add_debug_message(
+                    debug_messages,
+                    is_debug,
+                    typo_debug_check,
+                    word,
+                    typo,
+                    word_msg,
+                    typo_msg,
+                    debug_typo_matcher,
+                )
             continue
 
         # Note: Boundaries are determined in Stage 3 (collision resolution) where
@@ -215,7 +218,8 @@ def process_word(
         # For debug logging, we use NONE as a placeholder since boundary isn't determined yet.
         log_typo_pattern_match(debug_messages, typo, word, debug_typo_matcher)
 
-        log_typo_accepted(debug_messages, word, typo, debug_words)
+        if is_debug:
+            log_typo_accepted(debug_messages, word, typo, debug_words)
 
         # Store only (typo, word) - boundary will be determined in Stage 3
         corrections.append((typo, word))
@@ -1,9 +1,12 @@
 """Worker context and initialization for parallel collision resolution."""
 
 from dataclasses import dataclass
+from functools import lru_cache
 import threading
 
 from entroppy.core.boundaries import BoundaryIndex, BoundaryType
+from entroppy.matching import ExclusionMatcher
+from entroppy.utils.debug import DebugTypoMatcher
 
 
 @dataclass(frozen=True)
@@ -23,6 +26,8 @@ class CollisionResolutionContext:
         exclusion_set: Set of exclusion patterns (raw strings, not matcher)
         debug_words: Set of words to debug (exact matches)
         debug_typo_patterns: Set of debug typo patterns (raw strings, not matcher)
+        validation_index: Boundary index for validation_set, built once in the parent
+        source_index: Boundary index for source_words, built once in the parent
     """
 
     validation_set: frozenset[str]
@@ -34,25 +39,56 @@ class CollisionResolutionContext:
     exclusion_set: frozenset[str]
     debug_words: frozenset[str]
     debug_typo_patterns: frozenset[str]
+    validation_index: BoundaryIndex
+    source_index: BoundaryIndex
 
 
-# Thread-local storage for worker context and indexes
+@lru_cache(maxsize=4)
+def get_exclusion_matcher(exclusion_set: frozenset[str]) -> ExclusionMatcher:
+    """Get an ExclusionMatcher for a set of exclusion patterns, built once per set.
+
+    Matchers hold compiled regexes and can't be passed to workers, so each worker
+    builds its own. Caching on the (hashable) frozenset means a worker compiles them
+    once no matter how many tasks or passes ask for the same patterns.
+
+    Args:
+        exclusion_set: Exclusion patterns (raw strings)
+
+    Returns:
+        Shared ExclusionMatcher for these patterns
+    """
+    return ExclusionMatcher(set(exclusion_set))
+
+
+# Thread-local storage for worker context, indexes and per-worker derived state
 _worker_context = threading.local()
 _worker_indexes = threading.local()
+_worker_matchers = threading.local()
 
 
 def init_collision_worker(context: CollisionResolutionContext) -> None:
-    """Initialize worker process with context and build indexes eagerly.
+    """Initialize worker process with context and its prebuilt indexes.
 
     Args:
         context: CollisionResolutionContext to store in thread-local storage
     """
     _worker_context.value = context
 
-    # Build indexes eagerly during initialization
-    # This prevents the progress bar from freezing when workers start
-    _worker_indexes.validation_index = BoundaryIndex(context.validation_set)
-    _worker_indexes.source_index = BoundaryIndex(context.source_words)
+    # Indexes are built once in the parent and arrive with the context (inherited
+    # copy-on-write under fork, unpickled otherwise) instead of being rebuilt per worker
+    _worker_indexes.validation_index = context.validation_index
+    _worker_indexes.source_index = context.source_index
+
+    # Build matchers and mutable word sets once per worker instead of once per typo
+    # (matchers are not serializable due to compiled regex, so they can't be passed in)
+    _worker_matchers.exclusion_matcher = get_exclusion_matcher(context.exclusion_set)
+    _worker_matchers.debug_typo_matcher = (
+        DebugTypoMatcher.from_patterns(set(context.debug_typo_patterns))
+        if context.debug_typo_patterns
+        else None
+    )
+    _worker_matchers.user_words = set(context.user_words)
+    _worker_matchers.debug_words = set(context.debug_words)
 
 
 def get_collision_worker_context() -> CollisionResolutionContext:
@@ -92,6 +128,42 @@ def get_worker_indexes() -> tuple[BoundaryIndex, BoundaryIndex]:
         ) from e
 
 
+def get_worker_matchers() -> tuple[ExclusionMatcher, DebugTypoMatcher | None]:
+    """Get the exclusion and debug typo matchers from thread-local storage.
+
+    Returns:
+        Tuple of (exclusion_matcher, debug_typo_matcher)
+
+    Raises:
+        RuntimeError: If called before init_collision_worker
+    """
+    try:
+        return _worker_matchers.exclusion_matcher, _worker_matchers.debug_typo_matcher
+    except AttributeError as e:
+        raise RuntimeError(
+            "Collision resolution worker matchers not initialized. "
+            "Call init_collision_worker first."
+        ) from e
+
+
+def get_worker_word_sets() -> tuple[set[str], set[str]]:
+    """Get the user and debug word sets from thread-local storage.
+
+    Returns:
+        Tuple of (user_words, debug_words)
+
+    Raises:
+        RuntimeError: If called before init_collision_worker
+    """
+    try:
+        return _worker_matchers.user_words, _worker_matchers.debug_words
+    except AttributeError as e:
+        raise RuntimeError(
+            "Collision resolution worker word sets not initialized. "
+            "Call init_collision_worker first."
+        ) from e
+
+
 @dataclass(frozen=True)
 class CandidateSelectionContext:
     """Immutable context for candidate selection workers.
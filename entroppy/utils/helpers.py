@@ -5,22 +5,60 @@ import os
 from pathlib import Path
 import re
 from re import Pattern
-from typing import Callable, TextIO
+from typing import Any, Callable, TextIO
 
 from loguru import logger
 from wordfreq import word_frequency as _word_frequency
 
 
+@functools.lru_cache(maxsize=1024)
 def compile_wildcard_regex(pattern: str) -> Pattern:
     """Converts a simple wildcard pattern (* syntax) to a compiled regex object.
 
     e.g., 'in*' -> '^in.*$', '*in' -> '^.*in$', '*teh*' -> '^.*teh.*$'
+
+    Results are cached: exclusion checks recompile word patterns on every
+    correction, and compiled patterns are immutable, so callers can share them.
     """
     parts = [re.escape(part) for part in pattern.split("*")]
     regex_str = ".*".join(parts)
     return re.compile(f"^{regex_str}$")
 
 
+class BatchedProgress:
+    """Advance an optional progress bar once per batch rather than once per item.
+
+    Parallel stages consume worker results in a tight loop, and a tqdm update per
+    result costs more than the loop body itself.
+    """
+
+    __slots__ = ("_progress_bar", "_batch_size", "_pending")
+
+    def __init__(self, progress_bar: Any, batch_size: int) -> None:
+        """Initialize the batched progress wrapper.
+
+        Args:
+            progress_bar: tqdm progress bar, or None to track nothing
+            batch_size: Number of items to count before updating the bar
+        """
+        self._progress_bar = progress_bar
+        self._batch_size = batch_size
+        self._pending = 0
+
+    def advance(self) -> None:
+        """Count one processed item, updating the bar once a batch is complete."""
+        self._pending += 1
+        if self._progress_bar and self._pending >= self._batch_size:
+            self._progress_bar.update(self._pending)
+            self._pending = 0
+
+    def close(self) -> None:
+        """Report any remaining items and close the progress bar."""
+        if self._progress_bar:
+            self._progress_bar.update(self._pending)
+            self._progress_bar.close()
+
+
 def expand_file_path(filepath: str | None) -> str | None:
     """Expand user home directory in file path.
 
@@ -37,5 +37,19 @@ class SubstringIndex:
         Returns:
             List of indices where typo appears as substring
         """
-        result = self._rust_index.find_substring_conflicts(typo)
-        return list(result)
+        # The extension already returns a fresh list, no need to copy it
+        result: list[int] = self._rust_index.find_substring_conflicts(typo)
+        return result
+
+    def find_longer_containing(self) -> list[list[int]]:
+        """Find the longer typos that contain each indexed typo.
+
+        Runs every query in one call to the Rust implementation, which releases
+        the GIL while searching.
+
+        Returns:
+            One list per indexed typo, in index order, of the sorted unique indices
+            of the strictly longer typos containing it
+        """
+        result: list[list[int]] = self._rust_index.find_longer_containing()
+        return result
@@ -78,6 +78,60 @@ impl RustSubstringIndex {
     /// Returns:
     ///     List of indices where typo appears as substring (excluding self)
     pub fn find_substring_conflicts(&self, typo: &str) -> PyResult<Vec<usize>> {
+        let matched_typo_indices = self.occurrence_indices(typo);
+
+        // Filter out self-matches
+        let self_idx = self.typo_to_idx.get(typo);
+        let result: Vec<usize> = matched_typo_indices
+            .into_iter()
+            .filter(|idx| Some(idx) != self_idx)
+            .collect();
+
+        Ok(result)
+    }
+
+    /// Find the strictly longer typos that contain each indexed typo.
+    ///
+    /// Gives the same matches as calling find_substring_conflicts for every typo
+    /// and keeping the longer ones, but in one call that runs without the GIL.
+    /// Typos of the maximum length are not searched, nothing longer can contain them.
+    ///
+    /// Returns:
+    ///     One list per typo, in index order, of the sorted unique indices of the
+    ///     longer typos containing it
+    pub fn find_longer_containing(&self, py: Python<'_>) -> Vec<Vec<usize>> {
+        py.allow_threads(|| {
+            let max_len = self.typos.iter().map(|typo| typo.len()).max().unwrap_or(0);
+            self.typos
+                .iter()
+                .map(|typo| {
+                    if typo.len() >= max_len {
+                        return Vec::new();
+                    }
+                    let mut matches: Vec<usize> = self
+                        .occurrence_indices(typo)
+                        .into_iter()
+                        .filter(|&idx| self.typos[idx].len() > typo.len())
+                        .collect();
+                    matches.sort_unstable();
+                    matches.dedup();
+                    matches
+                })
+                .collect()
+        })
+    }
+
+    /// Get the list of typos (for compatibility/testing).
+    pub fn get_typos(&self) -> Vec<String> {
+        self.typos.clone()
+    }
+}
+
+impl RustSubstringIndex {
+    /// Indices of the typos containing the given string, one per occurrence.
+    ///
+    /// Uses binary search for O(log N) position lookup instead of O(N) linear scan.
+    fn occurrence_indices(&self, typo: &str) -> Vec<usize> {
         // Find all occurrences using suffix array
         // The suffix crate's positions() method returns &[u32] (slice of positions)
         let matches = self.suffix_array.positions(typo);
@@ -110,19 +164,7 @@ impl RustSubstringIndex {
             }
         }
 
-        // Filter out self-matches
-        let self_idx = self.typo_to_idx.get(typo);
-        let result: Vec<usize> = matched_typo_indices
-            .into_iter()
-            .filter(|idx| Some(idx) != self_idx)
-            .collect();
-
-        Ok(result)
-    }
-
-    /// Get the list of typos (for compatibility/testing).
-    pub fn get_typos(&self) -> Vec<String> {
-        self.typos.clone()
+        matched_typo_indices
     }
 }
 
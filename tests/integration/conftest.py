@@ -0,0 +1,25 @@
+"""Shared fixtures for integration tests."""
+
+from english_words import get_english_words_set
+import pytest
+
+
+@pytest.fixture(scope="session")
+def english_words() -> frozenset[str]:
+    """English words dictionary, read from the package once per test session."""
+    return frozenset(get_english_words_set(["web2", "gcide"], lower=True))
+
+
+@pytest.fixture(autouse=True)
+def cached_english_words(
+    english_words: frozenset[str],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Serve dictionary loads from the session copy instead of re-reading the package.
+
+    Each call gets a fresh mutable set, since callers add include words to it.
+    """
+    monkeypatch.setattr(
+        "entroppy.data.dictionary.get_english_words_set",
+        lambda *_args, **_kwargs: set(english_words),
+    )
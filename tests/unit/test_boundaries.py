@@ -4,8 +4,14 @@ Tests verify boundary detection logic that determines when typos need word bound
 to prevent false triggers. Each test has a single assertion and focuses on behavior.
 """
 
+import pickle
+
 from entroppy.core import BoundaryType
 from entroppy.core.boundaries import (
+    MAX_EXAMPLE_WORDS,
+    TRIGGER_END,
+    TRIGGER_START,
+    TRIGGER_SUBSTRING,
     BoundaryIndex,
     determine_boundaries,
     is_substring_of_any,
@@ -14,6 +20,76 @@ from entroppy.core.boundaries import (
 )
 
 
+class TestExampleWords:
+    """Test cached example word lookups on BoundaryIndex."""
+
+    def test_prefix_examples_exclude_exact_match(self) -> None:
+        """When the typo is itself a word, it is not its own prefix example."""
+        index = BoundaryIndex({"test", "testing"})
+        assert index.get_prefix_examples("test") == ("testing",)
+
+    def test_suffix_examples_capped_at_max(self) -> None:
+        """When many words share the suffix, at most MAX_EXAMPLE_WORDS are kept."""
+        index = BoundaryIndex({"atest", "btest", "ctest", "dtest"})
+        assert len(index.get_suffix_examples("test")) == MAX_EXAMPLE_WORDS
+
+    def test_substring_examples_only_middle_matches(self) -> None:
+        """Substring examples skip words where the typo is a prefix or suffix."""
+        index = BoundaryIndex({"testing", "attest", "atestb"})
+        assert index.get_substring_examples("test") == ("atestb",)
+
+    def test_unknown_typo_has_no_examples(self) -> None:
+        """When typo appears in no word, no substring examples are returned."""
+        index = BoundaryIndex({"testing"})
+        assert index.get_substring_examples("xyz") == ()
+
+
+class TestPickling:
+    """Test BoundaryIndex pickling for handing indexes to worker processes."""
+
+    def test_round_trip_keeps_trigger_mask(self) -> None:
+        """A pickled and restored index answers trigger mask lookups the same way."""
+        index = BoundaryIndex({"testing", "attest"})
+        restored = pickle.loads(pickle.dumps(index))
+        assert restored.trigger_mask == index.trigger_mask
+
+    def test_round_trip_rebuilds_examples_on_demand(self) -> None:
+        """Example words are not pickled, but a restored index still finds them."""
+        index = BoundaryIndex({"testing"})
+        index.get_prefix_examples("test")
+        restored = pickle.loads(pickle.dumps(index))
+        assert restored.get_prefix_examples("test") == ("testing",)
+
+
+class TestTriggerMask:
+    """Test precomputed trigger mask behavior."""
+
+    def test_prefix_sets_start_and_substring_bits(self) -> None:
+        """When typo is only a prefix of a word, start and substring bits are set."""
+        index = BoundaryIndex({"testing"})
+        assert index.trigger_mask["test"] == TRIGGER_START | TRIGGER_SUBSTRING
+
+    def test_suffix_sets_end_and_substring_bits(self) -> None:
+        """When typo is only a suffix of a word, end and substring bits are set."""
+        index = BoundaryIndex({"attest"})
+        assert index.trigger_mask["test"] == TRIGGER_END | TRIGGER_SUBSTRING
+
+    def test_middle_sets_only_substring_bit(self) -> None:
+        """When typo is in the middle of a word, only the substring bit is set."""
+        index = BoundaryIndex({"atestb"})
+        assert index.trigger_mask["test"] == TRIGGER_SUBSTRING
+
+    def test_exact_match_has_no_mask(self) -> None:
+        """When typo equals the only word, it has no mask entry."""
+        index = BoundaryIndex({"test"})
+        assert "test" not in index.trigger_mask
+
+    def test_word_prefix_of_other_word_sets_start_bit(self) -> None:
+        """When a word is also a prefix of another word, the start bit is set."""
+        index = BoundaryIndex({"test", "testing"})
+        assert index.trigger_mask["test"] & TRIGGER_START
+
+
 class TestIsSubstringOfAny:
     """Test substring detection behavior."""
 
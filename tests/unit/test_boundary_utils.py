@@ -4,14 +4,23 @@ Tests verify boundary selection and override logic. Each test has a single asser
 and focuses on behavior.
 """
 
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 from entroppy.core import BoundaryType
+from entroppy.core.boundaries import BoundaryIndex
+from entroppy.resolution.boundaries.logging import (
+    _determine_boundary_order,
+    _get_matching_patterns,
+)
 from entroppy.resolution.boundaries.utils import (
+    _get_example_words_with_prefix,
+    _get_example_words_with_substring,
     _should_skip_short_typo,
     apply_user_word_boundary_override,
     choose_strictest_boundary,
 )
+from entroppy.resolution.processing.helpers import _prepare_boundary_and_collect_details
+from entroppy.utils.debug import DebugTypoMatcher
 
 
 class TestChooseStrictestBoundary:
@@ -229,3 +238,101 @@ class TestShouldSkipShortTypo:
         result = _should_skip_short_typo(typo, word, min_typo_length, min_word_length)
 
         assert result is False
+
+
+class TestExampleWords:
+    """Test example word collection used in debug logging."""
+
+    def test_prefix_examples_capped_at_three(self) -> None:
+        """When many words share the prefix, at most three examples are returned."""
+        validation_index = BoundaryIndex({"testa", "testb", "testc", "testd"})
+        source_index = BoundaryIndex({"teste"})
+        examples = _get_example_words_with_prefix("test", validation_index, source_index)
+        assert len(examples) == 3
+
+    def test_prefix_examples_skip_duplicates_across_indexes(self) -> None:
+        """When a word is in both indexes, it is only listed once."""
+        validation_index = BoundaryIndex({"testing"})
+        source_index = BoundaryIndex({"testing", "tester"})
+        examples = _get_example_words_with_prefix("test", validation_index, source_index)
+        assert sorted(examples) == ["tester", "testing"]
+
+    def test_substring_examples_exclude_prefix_and_suffix_matches(self) -> None:
+        """Only words containing typo in the middle are substring examples."""
+        validation_index = BoundaryIndex(frozenset({"testing", "attest", "atestb"}))
+        source_index = BoundaryIndex(set())
+        examples = _get_example_words_with_substring("test", validation_index, source_index)
+        assert examples == ["atestb"]
+
+
+class TestGetMatchingPatterns:
+    """Test per-typo caching of debug pattern matches."""
+
+    def test_cache_reuses_patterns_for_same_boundary(self) -> None:
+        """When the same boundary is looked up twice, the matcher is queried once."""
+        matcher = MagicMock()
+        matcher.get_matching_patterns.return_value = ["test"]
+        patterns_cache: dict[BoundaryType, list[str]] = {}
+        for _ in range(2):
+            _get_matching_patterns("test", BoundaryType.NONE, matcher, patterns_cache)
+        assert matcher.get_matching_patterns.call_count == 1
+
+    def test_returns_none_without_matcher(self) -> None:
+        """When there is no debug matcher, no patterns are returned."""
+        assert _get_matching_patterns("test", BoundaryType.NONE, None, {}) is None
+
+
+class TestDetermineBoundaryOrder:
+    """Test boundary order selection from the target word relationship."""
+
+    def test_prefix_and_suffix_of_target_skips_left(self) -> None:
+        """When typo is both prefix and suffix of target, LEFT is not tried."""
+        boundary_order, _ = _determine_boundary_order("aba", "ababa")
+        assert BoundaryType.LEFT not in boundary_order
+
+    def test_middle_of_target_tries_only_none_and_both(self) -> None:
+        """When typo is in the middle of target, only NONE and BOTH are tried."""
+        boundary_order, _ = _determine_boundary_order("est", "testing")
+        assert boundary_order == (BoundaryType.NONE, BoundaryType.BOTH)
+
+    def test_no_word_tries_all_boundaries(self) -> None:
+        """When there is no target word, all four boundaries are tried."""
+        boundary_order, _ = _determine_boundary_order("test", None)
+        assert len(boundary_order) == 4
+
+
+class TestPrepareBoundaryDetails:
+    """Test when boundary selection details are collected for later logging."""
+
+    @staticmethod
+    def _details(debug_enabled: bool, debug_typo_matcher: DebugTypoMatcher | None) -> dict | None:
+        with patch(
+            "entroppy.resolution.processing.helpers.is_debug_enabled",
+            return_value=debug_enabled,
+        ):
+            _, boundary_details, _ = _prepare_boundary_and_collect_details(
+                "tset",
+                "test",
+                BoundaryType.NONE,
+                min_typo_length=3,
+                min_word_length=3,
+                user_words=set(),
+                debug_words=set(),
+                debug_typo_matcher=debug_typo_matcher,
+                validation_index=BoundaryIndex({"test"}),
+                source_index=BoundaryIndex({"test"}),
+            )
+        return boundary_details
+
+    def test_collects_details_for_debug_typo_when_debug_enabled(self) -> None:
+        """When typo matches a debug pattern and DEBUG is enabled, details are collected."""
+        details = self._details(True, DebugTypoMatcher.from_patterns({"tset"}))
+        assert details is not None
+
+    def test_skips_details_for_debug_typo_when_debug_disabled(self) -> None:
+        """When DEBUG output is disabled, no details are collected for a debug typo."""
+        assert self._details(False, DebugTypoMatcher.from_patterns({"tset"})) is None
+
+    def test_skips_details_without_debug_typo_matcher(self) -> None:
+        """When there is no debug typo matcher, no details are collected."""
+        assert self._details(True, None) is None
@@ -8,6 +8,14 @@ import pytest
 
 from entroppy.core import BoundaryType
 from entroppy.core.boundaries import BoundaryIndex
+from entroppy.resolution.boundaries.selection import (
+    choose_boundaries_for_typos,
+    choose_boundary_for_typo,
+)
+from entroppy.resolution.false_trigger_check import (
+    _check_false_trigger_with_details,
+    _would_cause_false_trigger,
+)
 from entroppy.resolution.passes import (
     CandidateSelectionPass,
     PatternGeneralizationPass,
@@ -242,3 +250,75 @@ class TestPatternSubstringFalseTriggers:
 
         simet_patterns = [p for p in state.active_patterns if p[0] == "simet"]
         assert len(simet_patterns) == 0
+
+
+class TestWouldCauseFalseTriggerFastPath:
+    """Test that the fast path agrees with the detailed false trigger check."""
+
+    def test_fast_path_matches_detailed_check(self) -> None:
+        """Fast path verdict matches the detailed check for every boundary."""
+        validation_index = BoundaryIndex({"testing", "attest", "atestb"})
+        source_index = BoundaryIndex({"contest"})
+        cases = [
+            (typo, boundary, target)
+            for typo in ("test", "tes", "est", "xyz")
+            for boundary in BoundaryType
+            for target in (None, "tests", "test")
+        ]
+        mismatches = [
+            case
+            for case in cases
+            if _would_cause_false_trigger(
+                case[0], case[1], validation_index, source_index, target_word=case[2]
+            )
+            != _check_false_trigger_with_details(
+                case[0], case[1], validation_index, source_index, target_word=case[2]
+            )[0]
+        ]
+        assert not mismatches
+
+    def test_both_boundary_never_triggers(self) -> None:
+        """BOTH boundary never causes a false trigger."""
+        validation_index = BoundaryIndex({"testing"})
+        source_index = BoundaryIndex(set())
+        assert not _would_cause_false_trigger(
+            "test", BoundaryType.BOTH, validation_index, source_index
+        )
+
+    def test_right_boundary_ignores_prefix_matches(self) -> None:
+        """RIGHT boundary is safe when typo only appears as a prefix."""
+        validation_index = BoundaryIndex({"testing"})
+        source_index = BoundaryIndex(set())
+        assert not _would_cause_false_trigger(
+            "test", BoundaryType.RIGHT, validation_index, source_index
+        )
+
+
+class TestChooseBoundariesForTypos:
+    """Test that batched boundary selection matches per-typo selection."""
+
+    def test_batch_matches_single_typo_selection(self) -> None:
+        """Batched selection returns the same boundary as choose_boundary_for_typo."""
+        validation_index = BoundaryIndex({"testing", "attest", "atestb", "other"})
+        source_index = BoundaryIndex({"contest"})
+        typos = ["test", "test", "tes", "est", "xyz", "oth"]
+        words: list[str | None] = ["tests", None, "tesla", "best", "xyzzy", "other"]
+        expected = [
+            choose_boundary_for_typo(typo, validation_index, source_index, word=word)
+            for typo, word in zip(typos, words)
+        ]
+        result = choose_boundaries_for_typos(typos, words, validation_index, source_index)
+        assert result == expected
+
+
+class TestFalseTriggerDetails:
+    """Test the details returned by the detailed false trigger check."""
+
+    def test_details_report_prefix_from_validation(self) -> None:
+        """Detailed check reports a validation prefix hit on its own flag."""
+        validation_index = BoundaryIndex({"testing"})
+        source_index = BoundaryIndex(set())
+        _, details = _check_false_trigger_with_details(
+            "test", BoundaryType.LEFT, validation_index, source_index
+        )
+        assert details.would_trigger_start_val
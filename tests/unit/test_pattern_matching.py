@@ -7,6 +7,7 @@ Each test has a single assertion and uses type hints.
 import pytest
 
 from entroppy.matching import PatternMatcher
+from entroppy.utils import compile_wildcard_regex
 
 
 class TestPatternMatcherBehavior:
@@ -167,3 +168,10 @@ class TestPatternMatcherSpecialCharacters:
     def test_wildcard_with_special_chars(self) -> None:
         matcher = PatternMatcher({"*.txt"})
         assert matcher.matches("file.txt") is True
+
+
+class TestCompileWildcardRegex:
+    """Test compile_wildcard_regex caching."""
+
+    def test_repeated_pattern_returns_cached_regex(self) -> None:
+        assert compile_wildcard_regex("*tion") is compile_wildcard_regex("*tion")
@@ -0,0 +1,160 @@
+"""Unit tests for platform conflict detection helpers.
+
+Tests verify formatting, pair processing and the pass itself for substring conflicts.
+Each test has a single assertion and focuses on behavior.
+"""
+
+from entroppy.core import BoundaryType
+from entroppy.core.boundaries import BoundaryIndex
+from entroppy.core.types import MatchDirection
+from entroppy.platforms.qmk.backend import QMKBackend
+from entroppy.resolution.platform_conflicts.conflict_processing import (
+    process_conflict_combinations,
+)
+from entroppy.resolution.platform_conflicts.formatting_helpers import (
+    format_corrections,
+)
+from entroppy.resolution.platform_conflicts.platform_pass import PlatformSubstringConflictPass
+from entroppy.resolution.platform_conflicts.resolution import (
+    BOUNDARY_PRIORITY,
+    _identify_less_restrictive_boundary,
+)
+from entroppy.resolution.solver import PassContext
+from entroppy.resolution.state import DictionaryState
+
+
+class TestProcessConflictCombinations:
+    """Test conflict_processing.process_conflict_combinations behavior."""
+
+    @staticmethod
+    def _run(
+        *,
+        processed_pairs: set | None,
+        conflict_pairs: dict | None,
+        removal_set: set | None = None,
+    ) -> list:
+        """Resolve a core typo against its colon-prefixed form, returning the removals."""
+        shorter = ("aemr", "amer", BoundaryType.NONE)
+        longer = ("aemr", "amer", BoundaryType.LEFT)
+        corrections_to_remove: list = []
+        process_conflict_combinations(
+            "aemr",
+            ":aemr",
+            [(shorter, "aemr", BoundaryType.NONE)],
+            [(longer, "aemr", BoundaryType.LEFT)],
+            MatchDirection.RIGHT_TO_LEFT,
+            processed_pairs,
+            set() if removal_set is None else removal_set,
+            corrections_to_remove,
+            conflict_pairs,
+            BoundaryIndex({"america"}),
+            BoundaryIndex({"america"}),
+            set(),
+            None,
+        )
+        return corrections_to_remove
+
+    def test_records_removal_for_cross_boundary_pair(self) -> None:
+        """A core typo and its colon-prefixed form produce a removal."""
+        corrections_to_remove = self._run(processed_pairs=set(), conflict_pairs={})
+        assert len(corrections_to_remove) == 1
+
+    def test_marks_removed_correction(self) -> None:
+        """A removed correction is added to the removal set as it is recorded."""
+        corrections_to_remove_set: set = set()
+        corrections_to_remove = self._run(
+            processed_pairs=set(), conflict_pairs={}, removal_set=corrections_to_remove_set
+        )
+        assert corrections_to_remove_set == {corrections_to_remove[0][0]}
+
+    def test_records_removal_without_pair_deduplication(self) -> None:
+        """Removals are recorded when the caller skips pair deduplication."""
+        corrections_to_remove = self._run(processed_pairs=None, conflict_pairs={})
+        assert len(corrections_to_remove) == 1
+
+    def test_records_removal_without_conflict_pairs(self) -> None:
+        """Removals are recorded when conflict pairs are not being collected."""
+        corrections_to_remove = self._run(processed_pairs=set(), conflict_pairs=None)
+        assert len(corrections_to_remove) == 1
+
+
+class TestPlatformSubstringConflictPass:
+    """Test PlatformSubstringConflictPass behavior."""
+
+    def test_qmk_removes_colon_prefixed_typo_when_core_typo_is_safe(self) -> None:
+        """Of 'aemr' and ':aemr' for the same word, only the NONE correction is kept."""
+        validation_index = BoundaryIndex({"america"})
+        context = PassContext(
+            validation_set={"america"},
+            filtered_validation_set={"america"},
+            source_words_set={"america"},
+            user_words_set=set(),
+            exclusion_matcher=None,
+            exclusion_set=set(),
+            validation_index=validation_index,
+            source_index=validation_index,
+            platform=QMKBackend(),
+            min_typo_length=2,
+            collision_threshold=2.0,
+            jobs=1,
+            verbose=False,
+            use_gpu=False,
+        )
+        state = DictionaryState({"aemr": ["amer"]})
+        state.add_correction("aemr", "amer", BoundaryType.NONE, "test")
+        state.add_correction("aemr", "amer", BoundaryType.LEFT, "test")
+
+        PlatformSubstringConflictPass(context).run(state)
+
+        assert state.active_corrections == {("aemr", "amer", BoundaryType.NONE)}
+
+
+class TestIdentifyLessRestrictiveBoundary:
+    """Test resolution._identify_less_restrictive_boundary behavior."""
+
+    def test_prefers_lower_priority_longer_boundary(self) -> None:
+        """A NONE longer typo wins over a BOTH shorter typo."""
+        result = _identify_less_restrictive_boundary(
+            "teh", "tehy", "the", "they", BoundaryType.BOTH, BoundaryType.NONE
+        )
+        assert result == ("tehy", "they", BoundaryType.NONE, BoundaryType.BOTH)
+
+    def test_left_and_right_share_priority(self) -> None:
+        """LEFT and RIGHT boundaries are equally restrictive."""
+        result = _identify_less_restrictive_boundary(
+            "teh", "tehy", "the", "they", BoundaryType.LEFT, BoundaryType.RIGHT
+        )
+        assert result is None
+
+    def test_priority_covers_every_boundary(self) -> None:
+        """Every boundary type has a priority."""
+        assert set(BOUNDARY_PRIORITY) == set(BoundaryType)
+
+
+class TestFormatCorrections:
+    """Test formatting_helpers.format_corrections behavior."""
+
+    def test_groups_corrections_by_formatted_typo(self) -> None:
+        """Corrections that format to the same string share one entry."""
+        corrections = [
+            ("teh", "the", BoundaryType.NONE),
+            ("teh", "the", BoundaryType.LEFT),
+        ]
+        formatted_to_corrections, _ = format_corrections(
+            corrections, False, "test", lambda typo, _boundary: typo
+        )
+        assert len(formatted_to_corrections["teh"]) == 2
+
+    def test_maps_each_correction_to_formatted_typo(self) -> None:
+        """Each correction maps back to its formatted string."""
+        correction = ("aemr", "amer", BoundaryType.LEFT)
+        _, correction_to_formatted = format_corrections(
+            [correction], False, "test", lambda typo, _boundary: f":{typo}"
+        )
+        assert correction_to_formatted[correction] == ":aemr"
+
+    def test_without_format_function_uses_typo_unchanged(self) -> None:
+        """Passing no format function keeps each typo as its formatted string."""
+        correction = ("aemr", "amer", BoundaryType.LEFT)
+        _, correction_to_formatted = format_corrections([correction], False, "test", None)
+        assert correction_to_formatted[correction] == "aemr"
@@ -1,12 +1,24 @@
 """Tests for worker context without global state."""
 
 from multiprocessing import Pool
+from unittest.mock import patch
 
 import pytest
 
 from entroppy.core import Config
+from entroppy.core.boundaries import BoundaryIndex
 from entroppy.processing.stages.data_models import DictionaryData
+from entroppy.matching import ExclusionMatcher
 from entroppy.processing.stages.worker_context import WorkerContext, get_worker_context, init_worker
+from entroppy.resolution.collision import _process_single_word_worker
+from entroppy.resolution.worker_context import (
+    CollisionResolutionContext,
+    get_exclusion_matcher,
+    get_worker_indexes,
+    get_worker_matchers,
+    get_worker_word_sets,
+    init_collision_worker,
+)
 
 
 # Module-level worker functions (needed for multiprocessing)
@@ -119,3 +131,63 @@ class TestMultiprocessingBehavior:
         """Accessing context before initialization should provide clear error."""
         with pytest.raises(RuntimeError, match="Worker context not initialized"):
             get_worker_context()
+
+
+def _collision_context(debug_typo_patterns: frozenset[str]) -> CollisionResolutionContext:
+    """Build a minimal collision resolution context."""
+    return CollisionResolutionContext(
+        validation_set=frozenset(["word"]),
+        source_words=frozenset(["source"]),
+        freq_ratio=10.0,
+        min_typo_length=2,
+        min_word_length=2,
+        user_words=frozenset(["user"]),
+        exclusion_set=frozenset(["teh"]),
+        debug_words=frozenset(["debug"]),
+        debug_typo_patterns=debug_typo_patterns,
+        validation_index=BoundaryIndex(frozenset(["word"])),
+        source_index=BoundaryIndex(frozenset(["source"])),
+    )
+
+
+class TestCollisionWorkerState:
+    """Tests for per-worker state built by init_collision_worker."""
+
+    def test_exclusion_matcher_is_built_once_per_worker(self):
+        """Every task in a worker shares the matcher built at init."""
+        get_exclusion_matcher.cache_clear()
+        with patch(
+            "entroppy.resolution.worker_context.ExclusionMatcher", side_effect=ExclusionMatcher
+        ) as matcher_cls:
+            init_collision_worker(_collision_context(frozenset()))
+            for item in [("teh", "the"), ("wrod", "word"), ("soruce", "source")]:
+                _process_single_word_worker(item)
+        get_exclusion_matcher.cache_clear()
+        assert matcher_cls.call_count == 1
+
+    def test_debug_typo_matcher_is_none_without_patterns(self):
+        """No debug typo matcher is built when there are no debug typo patterns."""
+        init_collision_worker(_collision_context(frozenset()))
+        _, debug_typo_matcher = get_worker_matchers()
+        assert debug_typo_matcher is None
+
+    def test_word_sets_are_mutable_copies_of_context(self):
+        """User and debug words are available as plain sets."""
+        init_collision_worker(_collision_context(frozenset()))
+        assert get_worker_word_sets() == ({"user"}, {"debug"})
+
+    def test_worker_uses_indexes_built_by_parent(self):
+        """Workers reuse the context's boundary indexes instead of rebuilding them."""
+        context = _collision_context(frozenset())
+        init_collision_worker(context)
+        assert get_worker_indexes() == (context.validation_index, context.source_index)
+
+
+class TestExclusionMatcherCache:
+    """Tests for the cached exclusion matcher factory used by workers."""
+
+    def test_same_patterns_share_one_matcher(self):
+        """Equal pattern sets reuse the matcher instead of recompiling its regexes."""
+        first = get_exclusion_matcher(frozenset(["teh", "*ball"]))
+        second = get_exclusion_matcher(frozenset(["*ball", "teh"]))
+        assert first is second